@@ -15,4 +15,21 @@ ADD COLUMN received_date DATETIME NULL,
 ADD COLUMN status VARCHAR(20) NOT NULL DEFAULT 'pending'; -- e.g., 'pending', 'received', 'cancelled'
 
 -- Optional: Add an index on status for faster lookups
-ALTER TABLE reorders ADD INDEX idx_status (status);
\ No newline at end of file
+ALTER TABLE reorders ADD INDEX idx_status (status);
+
+-- Full-text index for product search in the GUI (falls back to LIKE without it)
+ALTER TABLE products ADD FULLTEXT INDEX ft_products (product_name, description, upc);
+
+-- Index for the dashboard's recent products list (ORDER BY updated_at DESC LIMIT 10)
+CREATE INDEX idx_products_updated ON products (updated_at DESC, product_id);
+
+-- Reject impossible case sizes and prices for every writer, not just the GUI
+-- (enforced by MySQL 8.0.16 and later)
+ALTER TABLE products
+ADD CONSTRAINT chk_products_case_size CHECK (case_size >= 1),
+ADD CONSTRAINT chk_products_unit_price CHECK (unit_price >= 0);
+
+-- Pending reorder lists (WHERE status = ... ORDER BY date_requested) read this
+-- index in order instead of filesorting; idx_status is a prefix of it
+CREATE INDEX idx_reorders_status_date ON reorders (status, date_requested);
+ALTER TABLE reorders DROP INDEX idx_status;
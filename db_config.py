@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+G2J Inventory Management System - Database Configuration
+
+Shared database settings for the G2J scripts and GUI. Connection details
+are read from the environment so credentials do not have to be edited in
+each script:
+
+    G2J_DB_HOST, G2J_DB_PORT, G2J_DB_USER, G2J_DB_PASSWORD, G2J_DB_NAME
+
+Connections are handed out from a shared pool so repeated connects within
+one process reuse open sockets (DBUtils when it is installed, otherwise
+a small built-in pool).
+execute_prepared() runs hot queries as server-side prepared statements,
+on connections from connect(prepared=True).
+"""
+
+import os
+import threading
+import time
+import pymysql #type: ignore
+from pymysql.constants import CLIENT #type: ignore
+
+try:
+    from dbutils.pooled_db import PooledDB #type: ignore
+except ImportError:
+    PooledDB = None
+
+# Configuration for database connection
+DB_CONFIG = {
+    "host": os.environ.get("G2J_DB_HOST", "localhost"),
+    "port": int(os.environ.get("G2J_DB_PORT", "3306")),
+    "user": os.environ.get("G2J_DB_USER", "root"),
+    "password": os.environ.get("G2J_DB_PASSWORD", "2842254K"),
+    "database": os.environ.get("G2J_DB_NAME", "G2J_InventoryManagement"),
+    "charset": "utf8mb4",
+    # Writes are grouped into explicit transactions and committed by the caller
+    "autocommit": False,
+    "cursorclass": pymysql.cursors.DictCursor
+}
+
+# Connection pool sizing (SimplePool, the fallback, only uses maxcached). ping=0 skips
+# the server round trip DBUtils otherwise makes on every checkout; a
+# connection that has gone stale is reopened by DBUtils when a query on it
+# fails, and the query is retried. SimplePool cannot retry a query, so it
+# pings instead, but only connections idle for over SIMPLE_POOL_PING_IDLE.
+# reset=True rolls back every connection handed back to the pool: with
+# autocommit off even a plain SELECT opens a transaction, and its snapshot
+# would otherwise hide later commits from the next borrower.
+POOL_CONFIG = {
+    "mincached": 2,
+    "maxcached": 5,
+    "maxconnections": 10,
+    "blocking": True,
+    "ping": 0,
+    "reset": True
+}
+# Seconds a SimplePool connection may sit idle before it is pinged on checkout
+SIMPLE_POOL_PING_IDLE = 30
+
+# Connections from connect(prepared=True) accept several statements per
+# query, which lets execute_prepared() set its parameters and run the
+# statement in one round trip. They come from their own smaller pool; every
+# other connection runs one statement per query, so string-built SQL cannot
+# carry a second statement.
+PREPARED_CONNECT_CONFIG = dict(DB_CONFIG, client_flag=CLIENT.MULTI_STATEMENTS)
+PREPARED_POOL_CONFIG = dict(POOL_CONFIG, mincached=1, maxconnections=5)
+
+_pools = {} # prepared (bool) -> pool
+_pool_lock = threading.Lock()
+
+class _PooledConnection:
+    """
+    Connection borrowed from SimplePool; close() hands it back.
+
+    Like the DBUtils proxy, the pymysql connection is kept in _con and
+    every other attribute is forwarded to it.
+    """
+
+    def __init__(self, pool, con):
+        self._pool = pool
+        self._con = con
+
+    def __getattr__(self, name):
+        return getattr(self._con, name)
+
+    def close(self):
+        """Return the connection to its pool (only the first call counts)."""
+        if self._con is not None:
+            con, self._con = self._con, None
+            self._pool.release(con)
+
+class SimplePool:
+    """
+    Minimal stand-in for PooledDB when DBUtils is not installed.
+
+    Keeps up to maxcached idle connections. A connection is rolled back
+    when it is returned, so the next borrower starts clean; that round
+    trip also shows it was alive. It is pinged when borrowed (reopening
+    it if the server has dropped it) only if it has been idle for over
+    SIMPLE_POOL_PING_IDLE seconds, so quick reuse costs no round trip.
+    """
+
+    def __init__(self, maxcached, **connect_kwargs):
+        self._connect_kwargs = connect_kwargs
+        self._maxcached = maxcached
+        self._idle = [] # (connection, time it was returned)
+        self._lock = threading.Lock()
+
+    def connection(self):
+        """
+        Borrow a connection, reusing an idle one when there is one.
+
+        Raises:
+            pymysql.MySQLError: If the database cannot be reached
+        """
+        with self._lock:
+            con, released_at = self._idle.pop() if self._idle else (None, None)
+        if con is None:
+            con = pymysql.connect(**self._connect_kwargs)
+        elif time.monotonic() - released_at > SIMPLE_POOL_PING_IDLE:
+            con.ping(reconnect=True)
+        return _PooledConnection(self, con)
+
+    def release(self, con):
+        """Roll back and keep a returned connection, or close it if the pool is full."""
+        try:
+            con.rollback()
+        except pymysql.MySQLError:
+            con.close() # Broken; the next borrower opens a new one
+            return
+        with self._lock:
+            if len(self._idle) < self._maxcached:
+                self._idle.append((con, time.monotonic()))
+                return
+        con.close()
+
+def connect(prepared=False):
+    """
+    Get a database connection from the shared pool.
+
+    Calling close() on the connection hands it back to the pool.
+
+    Args:
+        prepared (bool): Borrow from the pool of multi-statement connections
+            that execute_prepared() needs
+
+    Raises:
+        pymysql.MySQLError: If the database cannot be reached
+    """
+    with _pool_lock:
+        pool = _pools.get(prepared)
+        if pool is None:
+            pool_config = PREPARED_POOL_CONFIG if prepared else POOL_CONFIG
+            connect_config = PREPARED_CONNECT_CONFIG if prepared else DB_CONFIG
+            if PooledDB is None:
+                pool = SimplePool(pool_config["maxcached"], **connect_config)
+            else:
+                pool = PooledDB(creator=pymysql, **pool_config, **connect_config)
+            _pools[prepared] = pool
+    return pool.connection()
+
+def cursor(connection, cursorclass=None):
+    """
+    Get a reusable cursor for a connection.
+
+    Pooled connections keep one cursor per cursor class on the underlying
+    connection, so borrowing the same connection again skips creating a
+    new cursor. Other connections just get a fresh cursor. Do not close
+    the returned cursor; it lives as long as its connection. Buffered
+    cursors only, since the next execute() discards any unread results.
+
+    Args:
+        connection: Connection from connect()
+        cursorclass: pymysql cursor class, or None for the DB_CONFIG default
+
+    Returns:
+        A cursor on the connection
+    """
+    args = (cursorclass,) if cursorclass else ()
+    owner = getattr(connection, "_con", None)  # Pooled connection proxy (DBUtils or SimplePool)
+    if owner is None:
+        return connection.cursor(*args)
+
+    cursors = owner.__dict__.setdefault("_reusable_cursors", {})
+    cached = cursors.get(cursorclass)
+    if cached is None:
+        cached = cursors[cursorclass] = connection.cursor(*args)
+    return cached
+
+# MySQL error raised by EXECUTE when the session has no such prepared statement
+ER_UNKNOWN_STMT_HANDLER = 1243
+# MySQL error raised when a row breaks a CHECK constraint
+ER_CHECK_CONSTRAINT_VIOLATED = 3819
+# MySQL error raised when an insert repeats a unique key (e.g. an existing UPC)
+ER_DUP_ENTRY = 1062
+
+def execute_prepared(cursor, name, sql, params=()):
+    """
+    Run a server-side prepared statement, preparing it on first use.
+
+    Prepared statements belong to the MySQL session, so each (pooled)
+    connection prepares a statement the first time it runs it and reuses
+    the parsed statement after that. Parameters are passed through user
+    variables, as EXECUTE ... USING requires; the SET and the EXECUTE go
+    to the server together as one multi-statement query.
+
+    Args:
+        cursor: Cursor on a connection from connect(prepared=True)
+        name (str): Statement name, a plain SQL identifier
+        sql (str): Statement text, using ? placeholders
+        params (tuple): Values for the placeholders
+
+    Returns:
+        int: Number of affected rows
+
+    Raises:
+        pymysql.MySQLError: If the statement cannot be prepared or run
+    """
+    variables = [f"@{name}_{i}" for i in range(len(params))]
+    if variables:
+        execute_sql = f"EXECUTE {name} USING {', '.join(variables)}"
+        set_sql = "SET " + ", ".join(f"{var} = %s" for var in variables)
+    else:
+        execute_sql = f"EXECUTE {name}"
+
+    try:
+        if not variables:
+            return cursor.execute(execute_sql)
+        cursor.execute(f"{set_sql}; {execute_sql}", params)
+        cursor.nextset()  # Move from the SET's result to the EXECUTE's
+        return cursor.rowcount
+    except pymysql.MySQLError as e:
+        if e.args[0] != ER_UNKNOWN_STMT_HANDLER:
+            raise
+    # The variables were set before EXECUTE failed, so only prepare and rerun
+    cursor.execute(f"PREPARE {name} FROM %s", (sql,))
+    return cursor.execute(execute_sql)
@@ -2,86 +2,468 @@
 """
 G2J Inventory Management System - Sales Data Generator
 
-This script generates random sales data for testing the reorder system.
+This script generates random sales data for testing the reorder system,
+either as a text file of UPCs or as rows in the sales_test table.
 
 Usage:
     python generate_test_sales.py [number_of_sales] [output_file]
+                                  [--upc-file UPC_FILE] [--refresh-upcs]
+                                  [--seed SEED] [--target {file,db}]
 """
 
+import os
 import sys
+import argparse
+import errno
+import fcntl
+import mmap
+import pickle
 import random
 import pymysql #type: ignore
+import db_config
 
-# Configuration for database connection
-DB_CONFIG = {
-    "host": "localhost",
-    "user": "root",
-    "password": "2842254K",
-    "database": "G2J_InventoryManagement",
-    "charset": "utf8mb4",
-    "cursorclass": pymysql.cursors.DictCursor
-}
+try:
+    import numpy as np #type: ignore
+except ImportError:
+    np = None
 
-def generate_sales_data(connection, number_of_sales, output_file):
+try:
+    from numba import njit, prange #type: ignore
+except ImportError:
+    njit = None
+
+try:
+    import liburing #type: ignore
+except ImportError:
+    liburing = None
+
+# Number of sales generated and written per block (bounds memory for large runs)
+SALES_BLOCK_SIZE = 1_000_000
+# Runs at least this large are written with O_DIRECT where supported
+DIRECT_IO_MIN_SALES = 10_000_000
+# O_DIRECT buffers, lengths and offsets are aligned to this many bytes
+DIRECT_IO_ALIGNMENT = 4096
+# Page-aligned staging buffer for O_DIRECT writes (multiple of the alignment)
+DIRECT_IO_BUFFER_SIZE = 16 << 20
+# Runs at least this large sample indices with the Numba kernel, when
+# available, so the one-off JIT compile is amortized
+NUMBA_MIN_SALES = 10_000_000
+# io_uring submission queue depth and size of each queued write
+URING_QUEUE_DEPTH = 64
+URING_WRITE_SIZE = 1 << 20
+# Rows per multi-row INSERT (and per commit) when writing to sales_test
+SALES_INSERT_BATCH = 10_000
+# Cached UPC list, reused while the products table is unchanged
+UPC_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "g2j_upcs.pkl")
+
+if np is not None and njit is not None:
+    @njit(parallel=True, cache=True)
+    def _sample_indices(count, upper, out):
+        """Fill out[:count] with random indices in [0, upper) in parallel."""
+        for i in prange(count):
+            out[i] = np.random.randint(0, upper)
+else:
+    _sample_indices = None
+
+def sales_payload_blocks(upcs, number_of_sales, seed=None):
     """
-    Generate random sales data for testing.
+    Yield random sales as encoded bytes blocks, one UPC per line.
+    
+    Each block holds at most SALES_BLOCK_SIZE sales. Uses numpy's
+    vectorized RNG when numpy is installed, a parallel Numba kernel for
+    very large runs when Numba is installed too, and falls back to
+    random.Random.choices() otherwise.
+    
+    Passing a seed makes the output reproducible. Seeded runs skip the
+    Numba kernel, whose per-thread generators cannot be seeded from here.
+    
+    When every UPC has the same encoded length, the UPCs are stored once
+    as a fixed-width bytes array with the newline included, so a block is
+    produced by a single gather and tobytes() with no per-sale objects.
+    Otherwise each UPC is encoded once up front with its newline, and a
+    block is a single bytes join with no intermediate str.
     
     Args:
-        connection: Database connection
-        number_of_sales (int): Number of sales transactions to generate
-        output_file (str): Path to the output file
+        upcs (list): UPC codes to sample from
+        number_of_sales (int): Total number of sales to generate
+        seed (int, optional): Seed for the random generator
     """
+    use_numba = (_sample_indices is not None and seed is None
+                 and number_of_sales >= NUMBA_MIN_SALES)
+    # Bind the sampler once instead of resolving it on every block
+    choices = random.Random(seed).choices
+    encoded_lines = [upc.encode() + b"\n" for upc in upcs]
+    if np is not None:
+        width = len(encoded_lines[0])
+        if all(len(line) == width for line in encoded_lines):
+            upc_lines = np.array(encoded_lines, dtype=f"S{width}")
+        else:
+            upc_lines = None
+            upc_arr = np.empty(len(encoded_lines), dtype=object)
+            upc_arr[:] = encoded_lines
+        rng = np.random.default_rng(seed)
+        if use_numba:
+            idx_buffer = np.empty(min(number_of_sales, SALES_BLOCK_SIZE), dtype=np.int64)
+    
+    remaining = number_of_sales
+    while remaining > 0:
+        block_size = min(remaining, SALES_BLOCK_SIZE)
+        if np is None:
+            yield b"".join(choices(encoded_lines, k=block_size))
+        else:
+            if use_numba:
+                _sample_indices(block_size, len(upcs), idx_buffer)
+                idx = idx_buffer[:block_size]
+            else:
+                idx = rng.integers(0, len(upcs), size=block_size, dtype=np.int64)
+            
+            if upc_lines is not None:
+                yield upc_lines[idx].tobytes()
+            else:
+                yield b"".join(upc_arr[idx])
+        remaining -= block_size
+
+def _clear_direct_flag(fd):
+    """Turn off O_DIRECT on fd. Returns False if it was not set."""
+    flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+    if not flags & getattr(os, "O_DIRECT", 0):
+        return False
+    fcntl.fcntl(fd, fcntl.F_SETFL, flags & ~os.O_DIRECT)
+    return True
+
+def _write_all(fd, data):
+    """
+    Write all of data to fd, retrying short writes.
+    
+    If the filesystem rejects an O_DIRECT write, O_DIRECT is switched off
+    and the write is retried through the page cache.
+    """
+    view = memoryview(data)
+    while view:
+        try:
+            written = os.write(fd, view)
+        except OSError as e:
+            if e.errno != errno.EINVAL or not _clear_direct_flag(fd):
+                raise
+            continue
+        view = view[written:]
+
+def _pwrite_all(fd, data, offset):
+    """Write all of data to fd at offset, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+def _open_ring():
+    """Set up an io_uring instance, or return None if io_uring is unavailable."""
+    if liburing is None:
+        return None
+    ring = liburing.Ring()
     try:
-        # Get all UPCs from the database
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT upc FROM products")
-            products = cursor.fetchall()
+        liburing.io_uring_queue_init(URING_QUEUE_DEPTH, ring)
+    except Exception:
+        return None
+    return ring
+
+def _uring_write(ring, fd, payload, offset):
+    """
+    Write payload at offset through io_uring.
+    
+    The payload is split into URING_WRITE_SIZE slices; each queue-full of
+    slices is handed to the kernel with a single submit call and reaped
+    before the next batch is queued. Short writes are completed with pwrite.
+    """
+    cqe = liburing.Cqe()
+    position = 0
+    while position < len(payload):
+        batch = []
+        while position < len(payload) and len(batch) < URING_QUEUE_DEPTH:
+            chunk = payload[position:position + URING_WRITE_SIZE]
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_write(sqe, fd, chunk, offset + position)
+            liburing.io_uring_sqe_set_data64(sqe, len(batch))
+            batch.append((chunk, offset + position))
+            position += len(chunk)
+        
+        liburing.io_uring_submit_and_wait(ring, len(batch))
         
-        if not products:
-            print("No products found in the database.")
+        reaped = 0
+        while reaped < len(batch):
+            liburing.io_uring_wait_cqe(ring, cqe)
+            ready = liburing.io_uring_cq_ready(ring)
+            for i in range(ready):
+                entry = cqe[i]
+                chunk, chunk_offset = batch[entry.user_data]
+                if entry.res < 0:
+                    liburing.io_uring_cq_advance(ring, ready)
+                    raise OSError(-entry.res, os.strerror(-entry.res))
+                if entry.res < len(chunk):
+                    _pwrite_all(fd, chunk[entry.res:], chunk_offset + entry.res)
+            liburing.io_uring_cq_advance(ring, ready)
+            reaped += ready
+
+def write_sales_file(output_file, payloads, direct=False):
+    """
+    Write encoded sales blocks to a file through a raw file descriptor.
+    
+    Buffered writes are queued through io_uring when the liburing package
+    is installed and the kernel supports it, and use pwrite otherwise.
+    With direct=True the file is opened with O_DIRECT (Linux only) so the
+    data bypasses the page cache. Blocks are staged in a page-aligned mmap
+    buffer and written in aligned chunks; the final partial page is
+    zero-padded and the file is truncated back to its real length.
+    
+    Args:
+        output_file (str): Path to the output file
+        payloads (iterable): bytes blocks to write in order
+        direct (bool): Try to bypass the page cache with O_DIRECT
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    direct = direct and hasattr(os, "O_DIRECT")
+    try:
+        fd = os.open(output_file, flags | os.O_DIRECT if direct else flags, 0o644)
+    except OSError as e:
+        if not direct or e.errno != errno.EINVAL:
+            raise
+        direct = False
+        fd = os.open(output_file, flags, 0o644)
+    
+    try:
+        if not direct:
+            # Queue the writes through io_uring when it is available, and
+            # fall back to pwrite if the ring or its bindings cannot be used
+            ring = _open_ring()
+            try:
+                offset = 0
+                for payload in payloads:
+                    if ring is not None:
+                        try:
+                            _uring_write(ring, fd, payload, offset)
+                        except OSError:
+                            raise
+                        except Exception:
+                            liburing.io_uring_queue_exit(ring)
+                            ring = None
+                    if ring is None:
+                        _pwrite_all(fd, payload, offset)
+                    offset += len(payload)
+            finally:
+                if ring is not None:
+                    liburing.io_uring_queue_exit(ring)
             return
         
-        # Extract UPCs
-        upcs = [p['upc'] for p in products]
+        buffer = mmap.mmap(-1, DIRECT_IO_BUFFER_SIZE)
+        try:
+            total = 0
+            used = 0
+            for payload in payloads:
+                view = memoryview(payload)
+                while view:
+                    count = min(len(view), DIRECT_IO_BUFFER_SIZE - used)
+                    buffer[used:used + count] = view[:count]
+                    used += count
+                    view = view[count:]
+                    if used == DIRECT_IO_BUFFER_SIZE:
+                        _write_all(fd, buffer)
+                        total += used
+                        used = 0
+            
+            if used:
+                padded = -(-used // DIRECT_IO_ALIGNMENT) * DIRECT_IO_ALIGNMENT
+                buffer[used:padded] = bytes(padded - used)
+                _write_all(fd, memoryview(buffer)[:padded])
+                total += used
+                os.ftruncate(fd, total)
+        finally:
+            buffer.close()
+    finally:
+        os.close(fd)
+
+def load_upcs(connection):
+    """
+    Get all product UPCs, reusing the on-disk cache when it is still current.
+    
+    The cache is keyed by the server and database (G2J_DB_HOST, G2J_DB_PORT
+    and G2J_DB_NAME can point the script at another one) plus the product
+    count and highest product_id, which MySQL answers from the primary key
+    without reading the UPC column.
+    
+    Args:
+        connection: Database connection
+        
+    Returns:
+        list: UPC codes of all products
+    """
+    with connection.cursor(pymysql.cursors.Cursor) as cursor:
+        cursor.execute("SELECT COUNT(*), MAX(product_id) FROM products")
+        fingerprint = (db_config.DB_CONFIG["host"], db_config.DB_CONFIG["port"],
+                       db_config.DB_CONFIG["database"]) + tuple(cursor.fetchone())
         
-        # Generate random sales
-        with open(output_file, 'w') as file:
-            for _ in range(number_of_sales):
-                # Select a random UPC
-                upc = random.choice(upcs)
-                file.write(f"{upc}\n")
+        try:
+            with open(UPC_CACHE_FILE, 'rb') as file:
+                cached = pickle.load(file)
+            if cached['fingerprint'] == fingerprint:
+                return cached['upcs']
+        except (OSError, EOFError, pickle.PickleError, KeyError, TypeError):
+            pass  # Missing or unreadable cache, fall through to a full fetch
+        
+        # Get all UPCs from the database (tuple rows, no per-row dict)
+        cursor.execute("SELECT upc FROM products")
+        upcs = [row[0] for row in cursor.fetchall()]
+    
+    try:
+        os.makedirs(os.path.dirname(UPC_CACHE_FILE), exist_ok=True)
+        with open(UPC_CACHE_FILE, 'wb') as file:
+            pickle.dump({'fingerprint': fingerprint, 'upcs': upcs}, file)
+    except OSError as e:
+        print(f"Warning: Could not write UPC cache {UPC_CACHE_FILE}: {e}")
+    
+    return upcs
+
+def generate_sales_data(upcs, number_of_sales, output_file, seed=None):
+    """
+    Generate random sales data for testing.
+    
+    Args:
+        upcs (list): UPC codes to draw sales from
+        number_of_sales (int): Number of sales transactions to generate
+        output_file (str): Path to the output file
+        seed (int, optional): Seed for reproducible output
+    """
+    if not upcs:
+        print("No products found in the database.")
+        return
+    
+    try:
+        # Generate random sales in large blocks, one write() per block
+        payloads = sales_payload_blocks(upcs, number_of_sales, seed)
+        write_sales_file(output_file, payloads,
+                         direct=number_of_sales >= DIRECT_IO_MIN_SALES)
         
         print(f"Generated {number_of_sales} random sales transactions in {output_file}")
         
-    except pymysql.MySQLError as e:
-        print(f"Database error: {e}")
     except Exception as e:
         print(f"Error generating sales data: {e}")
 
-def main():
-    """Main function to generate test sales data."""
-    # Check command line arguments
-    if len(sys.argv) != 3:
-        print("Usage: python generate_test_sales.py [number_of_sales] [output_file]")
-        sys.exit(1)
+def _sales_insert_sql(row_count):
+    """Build a multi-row INSERT into sales_test for row_count UPCs."""
+    return "INSERT INTO sales_test (upc) VALUES " + ",".join(["(%s)"] * row_count)
+
+def insert_sales(connection, upcs, number_of_sales, seed=None):
+    """
+    Insert random sales into the sales_test table.
+    
+    Sales are sent as multi-row INSERT statements of SALES_INSERT_BATCH
+    rows, committing after each batch.
+    
+    Args:
+        connection: Database connection
+        upcs (list): UPC codes to draw sales from
+        number_of_sales (int): Number of sales to insert
+        seed (int, optional): Seed for reproducible output
+    """
+    choices = random.Random(seed).choices
+    full_batch_sql = _sales_insert_sql(SALES_INSERT_BATCH)
+    
+    remaining = number_of_sales
+    with connection.cursor() as cursor:
+        while remaining > 0:
+            batch_size = min(remaining, SALES_INSERT_BATCH)
+            sql = full_batch_sql if batch_size == SALES_INSERT_BATCH else _sales_insert_sql(batch_size)
+            cursor.execute(sql, choices(upcs, k=batch_size))
+            connection.commit()
+            remaining -= batch_size
+
+def generate_sales_to_db(upcs, number_of_sales, seed=None):
+    """
+    Generate random sales directly into the sales_test table.
+    
+    Args:
+        upcs (list): UPC codes to draw sales from
+        number_of_sales (int): Number of sales transactions to generate
+        seed (int, optional): Seed for reproducible output
+    """
+    if not upcs:
+        print("No products found in the database.")
+        return
     
     try:
-        number_of_sales = int(sys.argv[1])
-    except ValueError:
-        print("Error: Number of sales must be an integer.")
+        connection = db_config.connect()
+        insert_sales(connection, upcs, number_of_sales, seed)
+        print(f"Inserted {number_of_sales} random sales transactions into sales_test")
+    except pymysql.MySQLError as e:
+        print(f"Database error: {e}")
         sys.exit(1)
+    finally:
+        if 'connection' in locals():
+            connection.close()
+
+def fetch_upcs():
+    """
+    Connect to the database just long enough to read the UPC list.
     
-    output_file = sys.argv[2]
-    
-    # Connect to the database
+    Returns:
+        list: UPC codes of all products
+    """
     try:
-        connection = pymysql.connect(**DB_CONFIG)
-        generate_sales_data(connection, number_of_sales, output_file)
+        connection = db_config.connect()
+        return load_upcs(connection)
     except pymysql.MySQLError as e:
-        print(f"Database connection error: {e}")
+        print(f"Database error: {e}")
+        sys.exit(1)
     finally:
         if 'connection' in locals():
             connection.close()
 
+def read_upc_file(upc_file):
+    """Read UPC codes from a text file with one UPC per line."""
+    with open(upc_file, 'r') as file:
+        return [line for line in file.read().splitlines() if line]
+
+def write_upc_file(upc_file, upcs):
+    """Write UPC codes to a text file with one UPC per line."""
+    with open(upc_file, 'w') as file:
+        file.write("\n".join(upcs))
+        file.write("\n")
+
+def main():
+    """Main function to generate test sales data."""
+    # Check command line arguments
+    parser = argparse.ArgumentParser(description="Generate random sales data for testing the reorder system.")
+    parser.add_argument("number_of_sales", type=int, help="number of sales transactions to generate")
+    parser.add_argument("output_file", nargs="?",
+                        help="path to the output file (required with --target file)")
+    parser.add_argument("--upc-file",
+                        help="read UPCs from this text file (one per line) instead of the database; "
+                             "the file is exported from the database if it does not exist yet")
+    parser.add_argument("--refresh-upcs", action="store_true",
+                        help="re-export --upc-file from the database before generating")
+    parser.add_argument("--seed", type=int,
+                        help="seed the random generator for reproducible output")
+    parser.add_argument("--target", choices=("file", "db"), default="file",
+                        help="write sales to output_file or insert them into the sales_test table")
+    args = parser.parse_args()
+    
+    if args.target == "file" and not args.output_file:
+        parser.error("output_file is required with --target file")
+    if args.refresh_upcs and not args.upc_file:
+        parser.error("--refresh-upcs requires --upc-file")
+    
+    if args.upc_file and not args.refresh_upcs and os.path.exists(args.upc_file):
+        # Pure file mode, no database connection at all
+        upcs = read_upc_file(args.upc_file)
+    else:
+        upcs = fetch_upcs()
+        if args.upc_file:
+            write_upc_file(args.upc_file, upcs)
+            print(f"Exported {len(upcs)} UPCs to {args.upc_file}")
+    
+    if args.target == "db":
+        generate_sales_to_db(upcs, args.number_of_sales, args.seed)
+    else:
+        generate_sales_data(upcs, args.number_of_sales, args.output_file, args.seed)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
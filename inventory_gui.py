@@ -7,14 +7,26 @@ Management System, allowing users to search for products, update
 product configurations, and view reports.
 """
 import os
-import os
-import sys
+import re
+import math
+import csv
+import tempfile
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from datetime import datetime
 import pymysql #type: ignore
-import subprocess
-from collections import Counter
+import time
+from bisect import bisect_left, insort
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain
+try:
+    from cachetools import LFUCache, TTLCache #type: ignore
+except ImportError:
+    LFUCache = TTLCache = None
+import db_config
+import reorder_generator
 
 # Application Constants
 APP_TITLE = "G2J Inventory Management System"
@@ -23,15 +35,420 @@ WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 SALES_REPORTS_DIR = "/Users/kube/VSprojects/G2J_InventoryManagementSystem/SalesReports"
 REORDER_LISTS_DIR = "/Users/kube/VSprojects/G2J_InventoryManagementSystem/ReOrder_Lists"
+# Name of the optional FULLTEXT index used for product search (see alterTables.sql)
+PRODUCT_FULLTEXT_INDEX = "ft_products"
+# Characters with special meaning in MySQL boolean-mode full-text queries are
+# turned into spaces, so "K-Cup" searches for "K" and "Cup" like the index does
+# (a translate table built once, cheaper per search than a regex substitution)
+FULLTEXT_OPERATORS = str.maketrans('+-<>()~*"@\\', " " * 11)
+# Only words the FULLTEXT parser indexes are searched: word characters only,
+# at least innodb_ft_min_token_size (default 3) long
+FULLTEXT_WORD_RE = re.compile(r"\w+")
+FULLTEXT_MIN_WORD_LENGTH = 3
+# Search terms that are searched as a UPC prefix: ASCII digits only (str.isdigit
+# also accepts other Unicode digits), no longer than the upc column
+UPC_PREFIX_RE = re.compile(r"[0-9]{1,20}")
+# Product queries run as server-side prepared statements (? placeholders, see
+# db_config.execute_prepared). Searches select only the columns shown in the
+# results lists; the configuration screen loads the full row by id.
+# Searches show at most SEARCH_RESULT_LIMIT rows so a short term cannot pull
+# the whole catalog into the results list. One extra row is fetched to tell
+# whether any matches were left out.
+SEARCH_RESULT_LIMIT = 200
+SEARCH_COLUMNS_SQL = "SELECT product_id, upc, product_name, current_quantity FROM products "
+SEARCH_LIMIT_SQL = f" LIMIT {SEARCH_RESULT_LIMIT + 1}"
+SEARCH_UPC_PREFIX_SQL = SEARCH_COLUMNS_SQL + "WHERE upc LIKE ?" + SEARCH_LIMIT_SQL
+SEARCH_FULLTEXT_SQL = (SEARCH_COLUMNS_SQL + "WHERE MATCH(product_name, description, upc) "
+                       "AGAINST (? IN BOOLEAN MODE)" + SEARCH_LIMIT_SQL)
+SEARCH_LIKE_SQL = SEARCH_COLUMNS_SQL + "WHERE upc LIKE ? OR product_name LIKE ?" + SEARCH_LIMIT_SQL
+GET_PRODUCT_SQL = (
+    "SELECT product_id, upc, product_name, description, current_quantity, "
+    "category, case_size, unit_price FROM products WHERE product_id = ?"
+)
+UPDATE_PRODUCT_SQL = (
+    "UPDATE products SET product_name = ?, description = ?, category = ?, "
+    "current_quantity = ?, case_size = ?, unit_price = ? WHERE product_id = ?"
+)
+# New item form fields as (label, products column, type, default text). The
+# column order also drives INSERT_PRODUCT_SQL and the queued batch rows.
+NEW_PRODUCT_FIELDS = [
+    ("UPC", "upc", str, ""),
+    ("Product Name", "product_name", str, ""),
+    ("Description", "description", str, ""),
+    ("Category", "category", str, ""),
+    ("Current Quantity", "current_quantity", int, "0"),
+    ("Case Size", "case_size", int, "1"),
+    ("Unit Price ($)", "unit_price", float, "0.0"),
+]
+NEW_PRODUCT_COLUMNS = [column for _, column, _, _ in NEW_PRODUCT_FIELDS]
+# Longest text each VARCHAR products column holds (see store_database_schema.sql).
+# Checked up front: LOCAL loads would silently truncate longer values.
+PRODUCT_COLUMN_LENGTHS = {"upc": 20, "product_name": 100, "category": 50}
+# Largest unit_price a DECIMAL(10, 2) column holds
+MAX_UNIT_PRICE = 99999999.99
+# Once the user has confirmed it, saving a UPC that already exists updates that
+# product's details instead of failing. The quantity on hand is never
+# overwritten by the form's value. LAST_INSERT_ID(product_id) makes lastrowid
+# the product's id in both cases.
+UPSERT_KEPT_COLUMNS = ("upc", "current_quantity")
+UPSERT_PRODUCT_SUFFIX = " ON DUPLICATE KEY UPDATE product_id = LAST_INSERT_ID(product_id), " + ", ".join(
+    f"{column} = VALUES({column})" for column in NEW_PRODUCT_COLUMNS if column not in UPSERT_KEPT_COLUMNS)
+INSERT_PRODUCT_SQL = "INSERT INTO products ({}) VALUES ({})".format(
+    ", ".join(NEW_PRODUCT_COLUMNS), ", ".join(["?"] * len(NEW_PRODUCT_COLUMNS)))
+UPSERT_PRODUCT_SQL = INSERT_PRODUCT_SQL + UPSERT_PRODUCT_SUFFIX
+# Batch form of the same upsert for cursor.executemany (pymysql %s placeholders).
+# pymysql rewrites it into multi-row INSERTs, each kept under max_allowed_packet.
+INSERT_PRODUCTS_SQL = "INSERT INTO products ({}) VALUES ({})".format(
+    ", ".join(NEW_PRODUCT_COLUMNS), ", ".join(["%s"] * len(NEW_PRODUCT_COLUMNS))) + UPSERT_PRODUCT_SUFFIX
+# Bulk import of a validated, rewritten CSV file (no header row). LOCAL loads
+# skip rows whose UPC already exists instead of failing the whole file, and
+# turn other data errors into warnings, which are read back with SHOW WARNINGS.
+LOAD_PRODUCTS_CSV_SQL = (
+    "LOAD DATA LOCAL INFILE %s INTO TABLE products CHARACTER SET utf8mb4 "
+    "FIELDS TERMINATED BY ',' ENCLOSED BY '\"' ESCAPED BY '' "
+    "LINES TERMINATED BY '\\n' ({})".format(", ".join(NEW_PRODUCT_COLUMNS))
+)
+# Worker threads for database queries and file scans run off the Tk thread
+BACKGROUND_WORKERS = 4
+# How often (ms) the Tk thread checks whether background work has finished
+BACKGROUND_POLL_MS = 20
+# Search results and full product rows are reused until they expire
+# (seconds). LFU eviction (with cachetools; see make_cache) keeps frequently
+# searched products cached through bursts of one-off searches.
+QUERY_CACHE_SIZE = 512
+QUERY_CACHE_TTL = 30
+# Enter presses within this many ms are coalesced into one search
+SEARCH_DEBOUNCE_MS = 150
+# Suggestions are refreshed once typing pauses this long (scanners type a whole UPC faster)
+SUGGESTION_DEBOUNCE_MS = 100
+# Digit-only terms at least this long are treated as barcode scans and searched at once
+SCANNED_UPC_MIN_LENGTH = 12
+# Most search suggestions offered as the user types
+SUGGESTION_LIMIT = 10
+# Recent products are reused briefly so switching back to the dashboard is free
+RECENT_PRODUCTS_TTL = 5
+# Modification times shown in the sales and reorder file lists
+FILE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def fulltext_query(search_term):
+    """
+    Build a boolean-mode FULLTEXT query matching each word as a required prefix.
+    
+    Args:
+        search_term (str): Text the user searched for
+        
+    Returns:
+        str | None: The query, or None if no word in the term can match the
+        index (too short, or not a word), in which case a LIKE search is needed
+    """
+    words = [word for word in search_term.translate(FULLTEXT_OPERATORS).split()
+             if len(word) >= FULLTEXT_MIN_WORD_LENGTH and FULLTEXT_WORD_RE.fullmatch(word)]
+    if not words:
+        return None
+    return " ".join(f"+{word}*" for word in words)
+
+def clear_tree(tree):
+    """Remove every row from a Treeview in one Tk call (none if it is already empty)."""
+    children = tree.get_children()
+    if children:
+        tree.delete(*children)
+
+def list_text_files(directory):
+    """
+    List the .txt files in a directory, newest first.
+    
+    Each file is stat()ed once, for both the sort and the displayed time,
+    and the time is formatted straight from the timestamp (no datetime
+    object per file).
+    
+    Args:
+        directory (str): Directory to list
+        
+    Returns:
+        list[tuple]: (filename, mod_time_str, file_path) per file
+        
+    Raises:
+        OSError: If the directory cannot be listed
+    """
+    files = []
+    with os.scandir(directory) as scan:
+        for entry in scan:
+            if entry.name.endswith('.txt') and entry.is_file():
+                try:
+                    mod_time = entry.stat().st_mtime
+                except OSError:
+                    mod_time = None # Handle potential errors getting mod time
+                files.append((mod_time, entry.name, entry.path))
+    
+    # Sort files by modification time, newest first
+    files.sort(key=lambda f: f[0] or 0, reverse=True)
+    strftime, localtime = time.strftime, time.localtime
+    return [(filename, strftime(FILE_TIME_FORMAT, localtime(mod_time)) if mod_time is not None else "N/A", file_path)
+            for mod_time, filename, file_path in files]
+
+def run_reorder_generator(file_path):
+    """
+    Run reorder_generator on a sales file in this process, collecting its messages.
+    
+    Safe to run on a worker thread: the messages go to this call's own
+    list through the generator's log argument, so nothing else printed
+    meanwhile is mixed in (sys.stdout is left alone).
+    
+    Args:
+        file_path (str): Sales file to process
+        
+    Returns:
+        tuple[int, str]: Exit status (0 on success, as the script would
+        exit) and the generator's messages, one per line
+    """
+    messages = []
+    try:
+        reorder_generator.process_sales_file(file_path, log=messages.append)
+        status = 0
+    except SystemExit as e:
+        # The generator reports failures and then calls sys.exit(1)
+        status = e.code if isinstance(e.code, int) else 1
+    return status, "\n".join(messages)
+
+def parse_product_fields(values):
+    """
+    Convert the text entered for a new product and validate it.
+    
+    Args:
+        values (dict): Raw text keyed by NEW_PRODUCT_COLUMNS name; missing
+            or blank numeric fields take their default
+            
+    Returns:
+        dict: The product fields with numbers converted
+        
+    Raises:
+        ValueError: If a field is missing or invalid (the message is meant
+            for the user)
+    """
+    product_data = {column: (values.get(column) or "").strip() for column in NEW_PRODUCT_COLUMNS}
+    
+    if not product_data["upc"] or not product_data["product_name"]:
+        raise ValueError("UPC and Product Name are required.")
+    
+    for label, column, _, _ in NEW_PRODUCT_FIELDS:
+        max_length = PRODUCT_COLUMN_LENGTHS.get(column)
+        if max_length is not None and len(product_data[column]) > max_length:
+            raise ValueError(f"{label} cannot be longer than {max_length} characters.")
+    
+    try:
+        for _, column, field_type, default in NEW_PRODUCT_FIELDS:
+            if field_type is not str:
+                product_data[column] = field_type(product_data[column] or default)
+    except ValueError:
+        raise ValueError("Quantity and case size must be whole numbers and unit price a number.") from None
+    
+    if product_data["case_size"] < 1:
+        raise ValueError("Case size must be at least 1.")
+    
+    if product_data["current_quantity"] < 0:
+        raise ValueError("Quantity cannot be negative.")
+    
+    # float() also accepts "nan" and "inf", which nan < 0 would let through
+    if not math.isfinite(product_data["unit_price"]):
+        raise ValueError("Unit price must be a finite number.")
+    if product_data["unit_price"] < 0:
+        raise ValueError("Unit price cannot be negative.")
+    if product_data["unit_price"] > MAX_UNIT_PRICE:
+        raise ValueError(f"Unit price cannot be more than {MAX_UNIT_PRICE:,.2f}.")
+    
+    return product_data
 
-DB_CONFIG = {
-    "host": "localhost",
-    "user": "root",
-    "password": "2842254K",
-    "database": "G2J_InventoryManagement",
-    "charset": "utf8mb4",
-    "cursorclass": pymysql.cursors.DictCursor
-}
+def insert_rows(tree, rows, iid_column=None, tag_column=None):
+    """
+    Append rows of values to a Treeview.
+    
+    Takes rows that are already built, so the loop does nothing but the
+    Tk inserts; Tk redraws the tree once after the loop returns. Each row
+    goes straight to the Tcl "insert" command: ttk's insert() would first
+    rebuild an option list and quote every value into one Tcl string,
+    whereas a tuple is passed to Tcl as a list object as it is.
+    
+    Args:
+        tree (ttk.Treeview): Tree to append to
+        rows (iterable): One values tuple per row
+        iid_column (int): Index of a unique value in each row to use as the
+            item id, or None to let Tk number the items
+        tag_column (int): Index of a value in each row to store as the
+            item's only tag, or None for no tags
+    """
+    call = tree.tk.call
+    path = str(tree) # Tcl command name of the widget
+    if tag_column is not None:
+        for values in rows:
+            call(path, "insert", "", "end", "-values", values, "-tags", (values[tag_column],))
+    elif iid_column is None:
+        for values in rows:
+            call(path, "insert", "", "end", "-values", values)
+    else:
+        for values in rows:
+            call(path, "insert", "", "end", "-id", values[iid_column], "-values", values)
+
+def refill_tree(tree, rows, shown_rows):
+    """
+    Replace the rows of a Treeview, skipping the Tk calls if nothing changed.
+    
+    Args:
+        tree (ttk.Treeview): Tree to refill (without item ids)
+        rows (iterable): One values tuple per row
+        shown_rows (tuple): What refill_tree last returned for this tree, or
+            None if the tree has been changed some other way since
+            
+    Returns:
+        tuple: The rows now shown, to pass back as shown_rows next time
+    """
+    rows = tuple(rows)
+    if rows == shown_rows:
+        return shown_rows # Same rows (usually the same cached list): nothing to redraw
+    clear_tree(tree)
+    insert_rows(tree, rows)
+    return rows
+
+class SimpleCache:
+    """
+    Minimal stand-in for cachetools' LFUCache and TTLCache when cachetools
+    is not installed.
+
+    Keeps the maxsize most recently used entries (LRU rather than LFU
+    eviction); with a ttl, entries older than ttl seconds read as missing.
+    Only the operations the app uses are provided.
+    """
+
+    def __init__(self, maxsize, ttl=None):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data = OrderedDict() # key -> (stored_at, value), least recently used first
+
+    def get(self, key, default=None):
+        """Return the value for key, or default if it is missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        stored_at, value = entry
+        if self._ttl is not None and time.monotonic() - stored_at > self._ttl:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def pop(self, key, default=None):
+        """Remove key and return its value, or default if it is missing."""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        self._data.clear()
+
+def make_cache(maxsize, ttl=None):
+    """
+    Create a query result cache, from cachetools when it is installed.
+
+    Args:
+        maxsize (int): Most entries kept
+        ttl (float): Seconds an entry stays valid; None keeps entries until
+            they are evicted (an LFU cache with cachetools)
+
+    Returns:
+        A cache supporting get, item assignment and deletion, pop and clear
+    """
+    if LFUCache is None:
+        return SimpleCache(maxsize, ttl)
+    if ttl is None:
+        return LFUCache(maxsize=maxsize)
+    return TTLCache(maxsize=maxsize, ttl=ttl)
+
+class ProductPrefixIndex:
+    """
+    In-memory prefix index over product names and UPCs for search suggestions.
+    
+    Keys are lowercased and kept in one sorted list, so every key starting
+    with a given prefix sits in one contiguous run found by bisection; a
+    lookup never touches the database.
+    """
+    
+    def __init__(self, rows):
+        """
+        Build the index.
+        
+        Args:
+            rows (iterable): (product_id, upc, product_name) tuples
+        """
+        self.products = {}  # product_id -> (upc, product_name)
+        self.entries = []  # sorted (key, product_id, suggestion text)
+        for product_id, upc, product_name in rows:
+            self.products[product_id] = (upc, product_name)
+            self.entries.extend(self._entries_for(product_id, upc, product_name))
+        self.entries.sort()
+    
+    @staticmethod
+    def _entries_for(product_id, upc, product_name):
+        """Index entries for one product: its UPC and its name."""
+        entries = [(upc.lower(), product_id, upc)]
+        if product_name:
+            entries.append((product_name.lower(), product_id, product_name))
+        return entries
+    
+    def set_product(self, product_id, upc=None, product_name=None):
+        """
+        Add a product, or re-index one whose UPC or name changed.
+        
+        A product that is not indexed yet (e.g. added outside the app after
+        the index was loaded) is only added when both upc and product_name
+        are given; otherwise the call is ignored.
+        
+        Args:
+            product_id (int): Product to (re)index
+            upc (str): New UPC, or None to keep the indexed one
+            product_name (str): New name, or None to keep the indexed one
+        """
+        old = self.products.get(product_id)
+        if old is None:
+            if upc is None or product_name is None:
+                return # Nothing to fill the missing field from
+        else:
+            for entry in self._entries_for(product_id, *old):
+                i = bisect_left(self.entries, entry)
+                if i < len(self.entries) and self.entries[i] == entry:
+                    del self.entries[i]
+            upc = old[0] if upc is None else upc
+            product_name = old[1] if product_name is None else product_name
+        
+        self.products[product_id] = (upc, product_name)
+        for entry in self._entries_for(product_id, upc, product_name):
+            insort(self.entries, entry)
+    
+    def suggestions(self, prefix, limit=SUGGESTION_LIMIT):
+        """
+        Get names and UPCs starting with prefix (case-insensitive).
+        
+        Args:
+            prefix (str): Text typed so far
+            limit (int): Maximum number of suggestions
+            
+        Returns:
+            list[str]: Suggestion texts in key order
+        """
+        prefix = prefix.lower()
+        entries = self.entries
+        results = []
+        i = bisect_left(entries, (prefix,))
+        while i < len(entries) and len(results) < limit and entries[i][0].startswith(prefix):
+            results.append(entries[i][2])
+            i += 1
+        return results
 
 class InventoryApp(tk.Tk):
     """Main application class for the G2J Inventory Management System GUI."""
@@ -74,21 +491,45 @@ class InventoryApp(tk.Tk):
                              font=('Arial', 12, 'bold'), 
                              background="#f0f0f0")
         
+        # Worker threads for blocking queries, so the UI stays responsive
+        self.executor = ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # New item window, created on first use and hidden rather than destroyed
+        self.new_item_window = None
+        # New products queued by the new item window for one batch insert
+        self.pending_products = []
+        
+        # Query result caches (only touched from the Tk thread)
+        self.search_cache = make_cache(QUERY_CACHE_SIZE)
+        self.product_cache = make_cache(QUERY_CACHE_SIZE)
+        self.recent_products_cache = make_cache(1, RECENT_PRODUCTS_TTL)
+        # Bumped whenever products or reorders change, so screens can tell
+        # whether the pending reorders they show are still current
+        self.reorders_version = 0
+        # Bumped by invalidate_caches, so a query that started before a change
+        # can tell its result is stale
+        self.products_version = 0
+        
         # Connect to database
-        self.db_connection = self.connect_to_database()
+        self.db_connected = self.connect_to_database()
+        self.has_fulltext_index = self.detect_fulltext_index()
+        
+        # Search suggestion index and known categories, loaded in the
+        # background after startup
+        self.product_index = None
+        self.categories = []
+        if self.db_connected:
+            self.reload_product_lookups()
         
         # Create main container
         self.main_container = ttk.Frame(self)
         self.main_container.pack(fill=tk.BOTH, expand=True)
         
-        # Initialize frames dictionary
+        # Screens are built the first time they are shown (see get_frame)
+        self.frame_classes = {F.__name__: F for F in (DashboardFrame, ConfigurationFrame,
+                                                      ReportsFrame, ConfirmOrderFrame)}
         self.frames = {}
-        
-        # Create and add frames for different screens
-        for F in (DashboardFrame, ConfigurationFrame, ReportsFrame, ConfirmOrderFrame):
-            frame = F(self.main_container, self)
-            self.frames[F.__name__] = frame
-            frame.grid(row=0, column=0, sticky="nsew")
 
         # Configure the main container's grid
         self.main_container.grid_rowconfigure(0, weight=1)
@@ -97,79 +538,484 @@ class InventoryApp(tk.Tk):
         # Show dashboard by default
         self.show_frame("DashboardFrame")
     
+    def get_frame(self, frame_name):
+        """Get a screen by class name, building it on first use."""
+        frame = self.frames.get(frame_name)
+        if frame is None:
+            frame = self.frames[frame_name] = self.frame_classes[frame_name](self.main_container, self)
+            frame.grid(row=0, column=0, sticky="nsew")
+        return frame
+    
     def show_frame(self, frame_name):
         """Switch to the specified frame."""
-        frame = self.frames[frame_name]
+        frame = self.get_frame(frame_name)
         frame.tkraise()
         if hasattr(frame, "on_show"):
             frame.on_show()
     
+    def on_close(self):
+        """Stop the background workers and close the main window."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+    
+    def run_in_background(self, fn, on_done, *args):
+        """
+        Run fn(*args) on a worker thread and hand the outcome back to Tk.
+        
+        Tk widgets may only be touched from the main thread, so fn must not
+        use them. on_done(result, error) is called on the Tk thread once fn
+        finishes; error is the raised exception, or None on success.
+        
+        Args:
+            fn (callable): Blocking work, such as a database query
+            on_done (callable): Completion callback run on the Tk thread
+            *args: Arguments passed to fn
+        """
+        future = self.executor.submit(fn, *args)
+        self.after(BACKGROUND_POLL_MS, self._check_background, future, on_done)
+    
+    def _check_background(self, future, on_done):
+        """Deliver a finished background result, or check again shortly."""
+        if not future.done():
+            self.after(BACKGROUND_POLL_MS, self._check_background, future, on_done)
+            return
+        
+        error = future.exception()
+        on_done(None if error else future.result(), error)
+    
+    def invalidate_caches(self, product_id=None):
+        """
+        Drop cached query results after product data has changed.
+        
+        Args:
+            product_id (int): The only product whose details changed, so the
+                other cached product rows can be kept; None drops them all
+        """
+        self.search_cache.clear()
+        if product_id is None:
+            self.product_cache.clear()
+        else:
+            self.product_cache.pop(product_id, None)
+        self.recent_products_cache.clear()
+        self.reorders_version += 1
+        self.products_version += 1
+    
+    def cache_lookup(self, cache, key):
+        """
+        Get a cached query result that has not expired yet.
+        
+        Expired entries are removed, which also resets their LFU use count.
+        
+        Returns:
+            The cached value, or None on a miss
+        """
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > QUERY_CACHE_TTL:
+            del cache[key]
+            return None
+        return value
+    
+    def cache_store(self, cache, key, value):
+        """Cache a query result, timestamped for cache_lookup's expiry check."""
+        cache[key] = (time.monotonic(), value)
+    
     def connect_to_database(self):
-        """Establish a connection to the MySQL database."""
+        """
+        Check that the MySQL database is reachable.
+        
+        Borrowing a connection from each pool also opens their initial
+        connections, so the first query does not pay the connect cost.
+        
+        Returns:
+            bool: True if a connection could be made
+        """
         try:
-            connection = pymysql.connect(**DB_CONFIG)
+            with self.get_conn(), self.get_conn(prepared=True):
+                pass
             print("Successfully connected to the database.")
-            return connection
+            return True
         except pymysql.MySQLError as e:
             messagebox.showerror("Database Connection Error", 
                                 f"Error connecting to the database: {e}")
-            return None
+            return False
+    
+    @contextmanager
+    def get_conn(self, prepared=False):
+        """
+        Borrow a database connection for the duration of a with block.
         
-    def search_product(self, search_term):
-        """Search for products by UPC or name."""
-        if not self.db_connection:
-            messagebox.showerror("Database Error", "No database connection available.")
-            return []
+        Connections come from the shared pool in db_config; closing one
+        hands it back to the pool rather than dropping the socket.
+        autocommit is off, so writes are only kept once the block calls
+        commit(); if the block raises instead, its open transaction is
+        rolled back here and the row locks it holds are released at once.
         
+        Args:
+            prepared (bool): Borrow a connection that db_config.execute_prepared
+                can use
+        """
+        conn = db_config.connect(prepared)
         try:
-            with self.db_connection.cursor() as cursor:
-                # Search for products by UPC or name
-                query = """
-                    SELECT product_id, upc, product_name, description, current_quantity, 
-                           category, case_size, unit_price
-                    FROM products 
-                    WHERE upc LIKE %s OR product_name LIKE %s
-                """
-                cursor.execute(query, (f"%{search_term}%", f"%{search_term}%"))
-                products = cursor.fetchall()
-                
-                # Debug: Print the results to the terminal
-                print(f"Search results for '{search_term}': \n {products}")
-                
-                return products
-        except pymysql.MySQLError as e:
-            messagebox.showerror("Database Error", f"Error searching for products: {e}")
-            return []
+            yield conn
+        except Exception:
+            try:
+                conn.rollback()
+            except pymysql.MySQLError:
+                pass # The connection is gone, and the server discards the transaction itself
+            raise
+        finally:
+            conn.close()
         
-    def update_product(self, product_id, product_data):
-        """Update product details in the database."""
-        if not self.db_connection:
-            messagebox.showerror("Database Error", "No database connection available.")
+    def detect_fulltext_index(self):
+        """Check whether the products FULLTEXT search index has been created."""
+        if not self.db_connected:
             return False
         
         try:
-            with self.db_connection.cursor() as cursor:
-                # Prepare SQL update statement
-                sql = """
-                    UPDATE products 
-                    SET product_name = %s, description = %s, category = %s, 
-                        current_quantity = %s, case_size = %s, unit_price = %s 
-                    WHERE product_id = %s
-                """
-                cursor.execute(sql, (
-                    product_data["product_name"],
-                    product_data["description"],
-                    product_data["category"],
-                    product_data["current_quantity"],
-                    product_data["case_size"],
-                    product_data["unit_price"],
-                    product_id
-                ))
-                self.db_connection.commit()
-                return True
+            with self.get_conn() as conn:
+                cursor = db_config.cursor(conn)
+                cursor.execute("SHOW INDEX FROM products WHERE Key_name = %s", (PRODUCT_FULLTEXT_INDEX,))
+                return cursor.fetchone() is not None
         except pymysql.MySQLError as e:
-            messagebox.showerror("Database Error", f"Error updating product: {e}")
+            print(f"Could not check for full-text index, using LIKE search: {e}")
             return False
+        
+    def load_product_index(self):
+        """Read every product's id, UPC and name and index them. Runs on a worker thread."""
+        # A throwaway cursor: a reused one would keep every product row alive
+        # until its next query
+        with self.get_conn() as conn, conn.cursor(pymysql.cursors.Cursor) as cursor:
+            cursor.execute("SELECT product_id, upc, product_name FROM products")
+            return ProductPrefixIndex(cursor.fetchall())
+    
+    def set_product_index(self, index, error):
+        """Install the loaded suggestion index; suggestions stay off if it failed."""
+        if error:
+            print(f"Could not load the product suggestion index: {error}")
+            return
+        self.product_index = index
+    
+    def load_categories(self):
+        """Read the distinct product categories, sorted. Runs on a worker thread."""
+        with self.get_conn() as conn:
+            cursor = db_config.cursor(conn, pymysql.cursors.Cursor)
+            cursor.execute("SELECT DISTINCT category FROM products WHERE category <> '' ORDER BY category")
+            return [category for (category,) in cursor.fetchall()]
+    
+    def set_categories(self, categories, error):
+        """Install the loaded category list; the dropdown stays empty if it failed."""
+        if error:
+            print(f"Could not load product categories: {error}")
+            return
+        self.categories = categories
+    
+    def add_category(self, category):
+        """Add a category used by a newly saved product to the cached list."""
+        if category and category not in self.categories:
+            insort(self.categories, category)
+    
+    def reload_product_lookups(self):
+        """Re-read the suggestion index and category list in the background."""
+        self.run_in_background(self.load_product_index, self.set_product_index)
+        self.run_in_background(self.load_categories, self.set_categories)
+    
+    def search_product(self, search_term):
+        """
+        Search for products by UPC or name.
+        
+        All-digit terms are treated as a UPC prefix, which can use the
+        unique index on upc. Other terms use the FULLTEXT index when it
+        exists, with each word matched as a required prefix, and fall back
+        to a LIKE scan otherwise (or when no word is long enough to be in
+        the index).
+        
+        Safe to run on a worker thread; database errors are raised to the
+        caller rather than shown here.
+        """
+        fulltext = fulltext_query(search_term) if self.has_fulltext_index else None
+        if UPC_PREFIX_RE.fullmatch(search_term):
+            name, query = "search_upc_prefix", SEARCH_UPC_PREFIX_SQL
+            params = (f"{search_term}%",)
+        elif fulltext:
+            name, query = "search_fulltext", SEARCH_FULLTEXT_SQL
+            params = (fulltext,)
+        else:
+            name, query = "search_like", SEARCH_LIKE_SQL
+            params = (f"%{search_term}%", f"%{search_term}%")
+        
+        # Tuple rows in (product_id, upc, product_name, current_quantity)
+        # order, matching the products tree columns
+        with self.get_conn(prepared=True) as conn:
+            cursor = db_config.cursor(conn, pymysql.cursors.Cursor)
+            # Search for products by UPC or name
+            db_config.execute_prepared(cursor, name, query, params)
+            products = cursor.fetchall()
+            
+            # Debug: Print the result count to the terminal (the rows themselves
+            # are not formatted; a large result spent longer in repr() than in MySQL)
+            print(f"Search results for {search_term!r}: {len(products)} rows")
+            
+            return products
+        
+    def existing_upcs(self, upcs):
+        """
+        Find which of the given UPCs already belong to a product.
+        
+        Args:
+            upcs (iterable): UPCs to look up
+            
+        Returns:
+            set: The UPCs that exist
+            
+        Raises:
+            pymysql.MySQLError: If the query fails
+        """
+        upcs = tuple(upcs)
+        if not upcs:
+            return set()
+        with self.get_conn() as conn:
+            cursor = db_config.cursor(conn, pymysql.cursors.Cursor)
+            cursor.execute("SELECT upc FROM products WHERE upc IN %s", (upcs,))
+            return {upc for (upc,) in cursor.fetchall()}
+    
+    def insert_products(self, rows):
+        """
+        Insert new products with multi-row INSERT statements in one transaction.
+        
+        Rows whose UPC already exists update that product's details instead
+        (its quantity on hand is kept); callers confirm this with the user.
+        
+        Args:
+            rows (list): Tuples of values in NEW_PRODUCT_COLUMNS order
+                
+        Raises:
+            pymysql.MySQLError: If the insert fails (nothing is committed)
+        """
+        with self.get_conn() as conn:
+            cursor = db_config.cursor(conn)
+            try:
+                # One transaction (and one commit flush) for the whole batch.
+                # begin() also stops DBUtils from silently reconnecting mid-batch.
+                # unique_checks stays on: the upsert needs the upc unique key.
+                conn.begin()
+                cursor.executemany(INSERT_PRODUCTS_SQL, rows)
+                conn.commit()
+            except pymysql.MySQLError:
+                conn.rollback()
+                raise
+        
+    def insert_product(self, product_data, overwrite=False):
+        """
+        Insert one new product, or with overwrite update the product with
+        the same UPC, and commit it.
+        
+        Borrows its own pooled connection, so it is safe to run on a worker
+        thread.
+        
+        Args:
+            product_data (dict): Validated form values keyed by column name
+            overwrite (bool): Update the details of an existing product with
+                this UPC (keeping its quantity on hand) instead of failing
+            
+        Returns:
+            tuple: (product_id, affected rows), where affected rows is 1 for
+            an insert, 2 for an update and 0 if nothing changed
+            
+        Raises:
+            pymysql.MySQLError: If the insert fails; error ER_DUP_ENTRY if the
+                UPC already exists and overwrite is False
+        """
+        name, sql = ("upsert_product", UPSERT_PRODUCT_SQL) if overwrite else ("insert_product", INSERT_PRODUCT_SQL)
+        with self.get_conn(prepared=True) as conn:
+            # Insert the new product through the session's prepared statement
+            cursor = db_config.cursor(conn)
+            affected = db_config.execute_prepared(cursor, name, sql,
+                                                  tuple(product_data[column] for column in NEW_PRODUCT_COLUMNS))
+            conn.commit()
+            return cursor.lastrowid, affected
+        
+    def import_products_csv(self, path):
+        """
+        Bulk load new products from a CSV file with LOAD DATA LOCAL INFILE.
+        
+        The file needs a header row naming NEW_PRODUCT_COLUMNS (upc and
+        product_name at least). Every row is validated first and the clean
+        rows are written to a temporary file, which the server then reads in
+        one statement. Rows whose UPC already exists are skipped. Safe to
+        run on a worker thread.
+        
+        Args:
+            path (str): CSV file chosen by the user
+            
+        Returns:
+            tuple: (rows loaded, rows in the file, rows skipped as duplicate
+            UPCs, list of the server's other warning messages)
+            
+        Raises:
+            ValueError: If the file has no usable header or a row is invalid
+            pymysql.MySQLError: If the load fails (nothing is committed)
+        """
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            if not {"upc", "product_name"}.issubset(reader.fieldnames or ()):
+                raise ValueError("The CSV file needs a header row with upc and product_name columns.")
+            rows = []
+            for values in reader:
+                try:
+                    product_data = parse_product_fields(values)
+                except ValueError as e:
+                    raise ValueError(f"Line {reader.line_num}: {e}") from None
+                rows.append([product_data[column] for column in NEW_PRODUCT_COLUMNS])
+        
+        if not rows:
+            return 0, 0, 0, []
+        
+        with tempfile.NamedTemporaryFile("w", newline="", encoding="utf-8",
+                                         suffix=".csv", delete=False) as tmp:
+            csv.writer(tmp, lineterminator="\n").writerows(rows)
+        try:
+            # Only this connection allows LOCAL INFILE; pooled ones do not
+            conn = pymysql.connect(**db_config.DB_CONFIG, local_infile=True)
+            try:
+                # autocommit is off, so the load opens its own transaction
+                with conn.cursor(pymysql.cursors.Cursor) as cursor:
+                    loaded = cursor.execute(LOAD_PRODUCTS_CSV_SQL, (tmp.name,))
+                    # Each skipped duplicate leaves an ER_DUP_ENTRY warning; anything
+                    # else (e.g. a value the server had to adjust) is reported as is
+                    cursor.execute("SHOW WARNINGS")
+                    warnings = cursor.fetchall()
+                conn.commit()
+            except pymysql.MySQLError:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
+        finally:
+            os.unlink(tmp.name)
+        duplicates = sum(1 for _, code, _ in warnings if code == db_config.ER_DUP_ENTRY)
+        messages = [message for _, code, message in warnings if code != db_config.ER_DUP_ENTRY]
+        return loaded, len(rows), duplicates, messages
+        
+    def fetch_product(self, product_id):
+        """
+        Fetch every column the configuration screen needs for one product.
+        
+        Safe to run on a worker thread; use get_product() from Tk code so
+        the product cache is consulted first.
+        
+        Args:
+            product_id (int): Product to fetch
+            
+        Returns:
+            dict | None: The product row, or None if it does not exist
+            
+        Raises:
+            pymysql.MySQLError: If the query fails
+        """
+        with self.get_conn(prepared=True) as conn:
+            cursor = db_config.cursor(conn)
+            db_config.execute_prepared(cursor, "get_product", GET_PRODUCT_SQL, (product_id,))
+            return cursor.fetchone()
+    
+    def get_product(self, product_id, on_done):
+        """
+        Get a product's full row from the cache, or fetch it in the background.
+        
+        Args:
+            product_id (int): Product to get
+            on_done (callable): Called on the Tk thread as on_done(product, error);
+                product is None if it does not exist
+        """
+        product = self.cache_lookup(self.product_cache, product_id)
+        if product is not None:
+            on_done(product, None)
+            return
+        self.run_in_background(self.fetch_product,
+                               partial(self._product_fetched, product_id, self.products_version, on_done),
+                               product_id)
+    
+    def _product_fetched(self, product_id, version, on_done, product, error):
+        """Cache a product fetched by get_product() and pass it on."""
+        # A row read before invalidate_caches() may predate the change, so it is
+        # passed on but not cached
+        if product is not None and version == self.products_version:
+            self.cache_store(self.product_cache, product_id, product)
+        on_done(product, error)
+        
+    def update_product(self, product_id, product_data):
+        """
+        Update product details in the database.
+        
+        Borrows its own pooled connection, so it is safe to run on a worker
+        thread; call product_updated on the Tk thread once it succeeds.
+        
+        Args:
+            product_id (int): The product to update
+            product_data (dict): Validated form values keyed by column name
+            
+        Raises:
+            pymysql.MySQLError: If the update fails
+        """
+        with self.get_conn(prepared=True) as conn:
+            cursor = db_config.cursor(conn)
+            # Run the prepared update statement
+            db_config.execute_prepared(cursor, "update_product", UPDATE_PRODUCT_SQL, (
+                product_data["product_name"],
+                product_data["description"],
+                product_data["category"],
+                product_data["current_quantity"],
+                product_data["case_size"],
+                product_data["unit_price"],
+                product_id
+            ))
+            conn.commit()
+    
+    def product_updated(self, product_id, product_data):
+        """Bring the caches, categories and suggestions up to date after update_product."""
+        cached = self.cache_lookup(self.product_cache, product_id)
+        self.invalidate_caches(product_id)
+        if cached is not None:
+            # Write the saved values through so reopening the product needs no query
+            self.cache_store(self.product_cache, product_id, {**cached, **product_data})
+        self.add_category(product_data["category"])
+        if self.product_index is not None:
+            self.product_index.set_product(product_id, product_name=product_data["product_name"])
+
+    def confirm_reorder_delivery(self, reorder_id):
+        """
+        Mark a pending reorder received and add its units to the product's
+        stock, in a single transaction.
+
+        Safe to run on a worker thread; the caller should invalidate the
+        caches after a successful update.
+
+        Args:
+            reorder_id (int): The reorder to confirm
+
+        Returns:
+            bool: True if the delivery was recorded, False if the reorder is
+            no longer pending (already received or canceled)
+
+        Raises:
+            pymysql.MySQLError: If the update fails
+        """
+        with self.get_conn() as conn:
+            cursor = db_config.cursor(conn)
+            # One multi-table UPDATE: the status check and the stock change
+            # commit together, so a delivery can never be counted twice
+            affected = cursor.execute("""
+                UPDATE reorders r
+                JOIN products p ON p.product_id = r.product_id
+                SET p.current_quantity = p.current_quantity + r.quantity,
+                    r.status = 'RECEIVED',
+                    r.date_received = NOW()
+                WHERE r.reorder_id = %s AND r.status = 'PENDING'
+            """, (reorder_id,))
+            conn.commit()
+        return affected > 0
 
     def confirm_order_from_file(self, file_path):
         """
@@ -182,8 +1028,11 @@ class InventoryApp(tk.Tk):
 
         Returns:
             tuple[bool, str]: (success_status, message)
+
+        Safe to run on a worker thread; the caller should invalidate the
+        caches after a successful update.
         """
-        if not self.db_connection:
+        if not self.db_connected:
             return False, "Database connection is not available."
 
         upc_counts = Counter()
@@ -193,56 +1042,78 @@ class InventoryApp(tk.Tk):
 
         try:
             # --- 1. Read and count UPCs from the file ---
-            with open(file_path, 'r') as f:
-                for line in f:
-                    upc = line.strip()
-                    if upc: # Ignore empty lines
-                        upc_counts[upc] += 1
-                        processed_count += 1
+            # Read in one call and split/counted in C; only the distinct UPCs are decoded
+            with open(file_path, 'rb') as f:
+                line_counts = Counter(map(bytes.strip, f.read().splitlines()))
+            line_counts.pop(b"", None) # Empty lines
+            upc_counts.update({upc.decode(): count for upc, count in line_counts.items()})
+            processed_count = sum(upc_counts.values())
             if not upc_counts:
                 return False, f"File '{os.path.basename(file_path)}' is empty or contains no valid UPCs."
 
-            # --- 2. Process each UPC ---
-            with self.db_connection.cursor() as cursor:
-                self.db_connection.begin() # Start transaction
-
-                for upc, case_count in upc_counts.items():
-                    # Get product details (case_size, product_id)
-                    cursor.execute("SELECT product_id, case_size FROM products WHERE upc = %s", (upc,))
-                    product_info = cursor.fetchone()
-
-                    if not product_info:
-                        print(f"Warning: UPC {upc} from file not found in database. Skipping.")
-                        skipped_upcs.add(upc)
-                        continue # Skip this UPC
-
-                    product_id = product_info['product_id']
-                    case_size = product_info['case_size']
-
-                    if not isinstance(case_size, int) or case_size <= 0:
-                         print(f"Warning: Invalid case size ({case_size}) for UPC {upc}. Skipping.")
-                         skipped_upcs.add(upc)
-                         continue # Skip this UPC
-
-                    # Calculate quantity to add
-                    quantity_to_add = case_count * case_size
-
-                    # Update product quantity
-                    update_sql = """
-                        UPDATE products
-                        SET current_quantity = current_quantity + %s
-                        WHERE product_id = %s
-                    """
-                    rows_affected = cursor.execute(update_sql, (quantity_to_add, product_id))
-
-                    if rows_affected > 0:
-                        updated_products += 1
-                        print(f"Updated UPC {upc}: Added {case_count} cases ({quantity_to_add} units).")
-                    else:
-                         # This shouldn't happen if we found the product_id, but good to check
-                         print(f"Warning: Failed to update quantity for UPC {upc} (product_id {product_id}).")
-                         skipped_upcs.add(upc)
-                self.db_connection.commit() # Commit transaction
+            # --- 2. Look up every UPC at once, then apply all updates in one statement ---
+            with self.get_conn() as conn:
+                # Tuple rows: the lookup is unpacked by position, no dict per product
+                cursor = db_config.cursor(conn, pymysql.cursors.Cursor)
+                conn.begin() # Start transaction
+                try:
+                    cursor.execute("SELECT upc, product_id, case_size FROM products WHERE upc IN %s",
+                                   (tuple(upc_counts),))
+                    # (product_id, case_size) keyed by UPC
+                    by_upc = {upc: (product_id, case_size) for upc, product_id, case_size in cursor.fetchall()}
+
+                    updates = [] # (product_id, case_count) pairs
+                    received = [] # (upc, case_count, quantity_to_add), printed after the commit
+                    for upc, case_count in upc_counts.items():
+                        product_info = by_upc.get(upc)
+
+                        if not product_info:
+                            print(f"Warning: UPC {upc} from file not found in database. Skipping.")
+                            skipped_upcs.add(upc)
+                            continue # Skip this UPC
+
+                        product_id, case_size = product_info
+
+                        if not isinstance(case_size, int) or case_size <= 0:
+                             print(f"Warning: Invalid case size ({case_size}) for UPC {upc}. Skipping.")
+                             skipped_upcs.add(upc)
+                             continue # Skip this UPC
+
+                        # Quantity to add, for the report; the UPDATE multiplies by the
+                        # case size of the row it has locked
+                        quantity_to_add = case_count * case_size
+                        updates.append((product_id, case_count))
+                        received.append((upc, case_count, quantity_to_add))
+
+                    if updates:
+                        # Update every product quantity in one round trip, joining against
+                        # the (product_id, cases) pairs as a derived table so each row
+                        # is matched by key rather than by scanning a CASE list. Cases
+                        # are converted to units in SQL, so a case size changed since
+                        # the lookup above is still applied correctly.
+                        update_sql = (
+                            "UPDATE products p JOIN (SELECT %s AS product_id, %s AS cases"
+                            + " UNION ALL SELECT %s, %s" * (len(updates) - 1)
+                            + ") r ON p.product_id = r.product_id"
+                            " SET p.current_quantity = p.current_quantity + r.cases * p.case_size"
+                        )
+                        updated_products = cursor.execute(update_sql, list(chain.from_iterable(updates)))
+
+                        if updated_products < len(updates):
+                             # This shouldn't happen if we found the product_ids, but good to check
+                             print(f"Warning: Only {updated_products} of {len(updates)} products were updated.")
+                    conn.commit() # Commit transaction
+                except Exception:
+                    try:
+                        conn.rollback() # Rollback on error
+                    except Exception as rb_err:
+                        print(f"Error during rollback: {rb_err}")
+                    raise
+
+            # Report what was received in one write, once the row locks are released
+            if received:
+                print("\n".join(f"Updated UPC {upc}: Added {case_count} cases ({quantity} units)."
+                                for upc, case_count, quantity in received))
 
             # --- 3. Prepare summary message ---
             summary_lines = [f"Successfully processed file: {os.path.basename(file_path)}"]
@@ -258,16 +1129,8 @@ class InventoryApp(tk.Tk):
         except FileNotFoundError:
             return False, f"Error: File not found at {file_path}"
         except pymysql.MySQLError as db_err:
-            try:
-                self.db_connection.rollback() # Rollback on error
-            except Exception as rb_err:
-                 print(f"Error during rollback: {rb_err}")
             return False, f"Database error occurred: {db_err}"
         except Exception as e:
-            try:
-                self.db_connection.rollback() # Rollback on unexpected error
-            except Exception as rb_err:
-                 print(f"Error during rollback: {rb_err}")
             return False, f"An unexpected error occurred: {e}"
 
 class DashboardFrame(ttk.Frame):
@@ -314,13 +1177,30 @@ class DashboardFrame(ttk.Frame):
         search_label.grid(row=0, column=0, padx=(0, 5), sticky="w")
 
         self.search_var = tk.StringVar()
-        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=40)
-        search_entry.grid(row=0, column=1, sticky="ew", padx=(0, 5))
-        search_entry.bind("<Return>", self.perform_search) # Bind Enter key
+        # A combobox so product name/UPC suggestions can be offered while typing
+        self.search_entry = ttk.Combobox(search_frame, textvariable=self.search_var, width=40)
+        self.search_entry.grid(row=0, column=1, sticky="ew", padx=(0, 5))
+        self.search_entry.bind("<Return>", self.schedule_search) # Bind Enter key (debounced)
+        self.search_entry.bind("<KeyRelease>", self.schedule_suggestions)
+        self.search_entry.bind("<<ComboboxSelected>>", self.perform_search)
+        self.pending_search = None # after() id of a debounced search
+        self.pending_suggestions = None # after() id of a debounced suggestion refresh
+
+        # Product selection popup, built on first use and reused after that
+        self.selection_popup = None
+        self.products_rows = None # Rows currently in products_tree (see refill_tree)
+        self.recent_products_loading = False # True while fetch_recent_products is running
+        self.selection_rows = None # Rows currently in the selection popup's tree
+        self.selection_tree = None
 
         search_button = ttk.Button(search_frame, text="Search", command=self.perform_search)
         search_button.grid(row=0, column=2)
 
+        self.search_status_var = tk.StringVar()
+        search_status_label = ttk.Label(search_frame, textvariable=self.search_status_var, width=12)
+        search_status_label.grid(row=0, column=3, padx=(5, 0))
+        self.search_id = 0 # Incremented per search so stale results are ignored
+
         # --- Recent Products/Search Results Section ---
         results_frame = ttk.LabelFrame(self, text="Products", padding="10")
         # Use grid for this frame as well for consistency
@@ -381,67 +1261,80 @@ class DashboardFrame(ttk.Frame):
                                              command=self.load_pending_reorders) # Ensure this method exists
         refresh_reorders_button.pack(side=tk.LEFT, padx=5) # pack is okay inside this sub-frame
 
-        confirm_button = ttk.Button(reorder_buttons_frame, text="Confirm Selected Delivery", # Parent is reorder_buttons_frame
-                                    command=self.confirm_selected_delivery) # Ensure this method exists
-        confirm_button.pack(side=tk.LEFT) # pack is okay inside this sub-frame
+        self.confirm_delivery_button = ttk.Button(reorder_buttons_frame, text="Confirm Selected Delivery", # Parent is reorder_buttons_frame
+                                                  command=self.confirm_selected_delivery)
+        self.confirm_delivery_button.pack(side=tk.LEFT) # pack is okay inside this sub-frame
 
-        # --- Load initial data --- (Now after widgets are created)
-        self.load_recent_products()
-        self.load_pending_reorders() # Load pending reorders on init
+        # Initial data is loaded by on_show when the frame is first shown
+        self.reorders_version = None # controller.reorders_version the reorders list was loaded at
 
         # Place this button logically, perhaps below the reorders section
         new_item_button = ttk.Button(self, text="Enter New Item", command=self.open_new_item_window) # Use self.open_new_item_window
         new_item_button.grid(row=4, column=0, pady=(10, 0), sticky="e") # Use grid, maybe align right.
 
-    def load_pending_reorders(self): # Implementation
-        """Fetch and display pending reorders from the database."""
-        # Clear existing items
-        for item in self.reorders_tree.get_children():
-            self.reorders_tree.delete(item)
+    def load_pending_reorders(self, force=True): # Implementation
+        """
+        Fetch and display pending reorders from the database.
 
-        if not self.controller.db_connection:
+        Args:
+            force (bool): Query even if nothing has changed in the app since
+                the list was last loaded (Refresh List, which may pick up
+                changes made by the command-line scripts)
+        """
+        if not force and self.reorders_version == self.controller.reorders_version:
+            return # The list already shows the current pending reorders
+        self.reorders_version = self.controller.reorders_version
+
+        if not self.controller.db_connected:
             # Don't show messagebox here, just log or skip
             print("Warning: No database connection for loading reorders.")
+            clear_tree(self.reorders_tree)
             self.reorders_tree.insert("", "end", values=("Database connection error.", "", "", "", "", ""))
             return
 
-        try:
-            with self.controller.db_connection.cursor() as cursor:
-                # Fetch pending reorders along with product details
-                sql = """
-                    SELECT r.reorder_id, p.product_id, p.upc, p.product_name,
-                           r.quantity, p.case_size, r.date_requested
-                    FROM reorders r
-                    JOIN products p ON r.product_id = p.product_id
-                    WHERE r.status = 'pending'
-                    ORDER BY r.date_requested ASC
-                """
-                cursor.execute(sql)
-                pending_reorders = cursor.fetchall()
-
-            if not pending_reorders:
-                self.reorders_tree.insert("", "end", values=("No pending reorders.", "", "", "", "", ""))
-            else:
-                for reorder in pending_reorders:
-                    # Format date for display
-                    order_date_str = reorder['order_date'].strftime('%Y-%m-%d %H:%M') if reorder.get('order_date') else 'N/A'
-                    # Store necessary data within the item's values for later retrieval
-                    # Use reorder_id as item id (iid) for easy access
-                    self.reorders_tree.insert("", "end", values=(
-                        reorder['reorder_id'],
-                        reorder['upc'],
-                        reorder['product_name'],
-                        reorder['quantity'],
-                        reorder['case_size'],
-                        order_date_str
-                    ), iid=reorder['reorder_id'])
+        self.controller.run_in_background(self.fetch_pending_reorders, self.show_pending_reorders)
 
-        except pymysql.MySQLError as e:
-            messagebox.showerror("Database Error", f"Error fetching pending reorders: {e}")
-            self.reorders_tree.insert("", "end", values=(f"Error: {e}", "", "", "", "", ""))
-        except Exception as e:
-             messagebox.showerror("Error", f"An unexpected error occurred loading reorders: {e}")
-             self.reorders_tree.insert("", "end", values=(f"Error: {e}", "", "", "", "", ""))
+    def fetch_pending_reorders(self):
+        """
+        Query the pending reorders with their product details. Runs on a worker thread.
+
+        Returns:
+            tuple: Rows already in reorders_tree column order, with the date
+            formatted by MySQL
+        """
+        with self.controller.get_conn() as conn:
+            # Plain tuple rows: no per-row dict, and nothing left to reshape for the tree
+            cursor = db_config.cursor(conn, pymysql.cursors.Cursor)
+            # Fetch pending reorders along with product details (executed without
+            # parameters, so the DATE_FORMAT % signs are sent as-is)
+            sql = """
+                SELECT r.reorder_id, p.upc, p.product_name, r.quantity, p.case_size,
+                       COALESCE(DATE_FORMAT(r.date_requested, '%Y-%m-%d %H:%i'), 'N/A') AS order_date
+                FROM reorders r
+                JOIN products p ON r.product_id = p.product_id
+                WHERE r.status = 'pending'
+                ORDER BY r.date_requested ASC
+            """
+            cursor.execute(sql)
+            return cursor.fetchall()
+
+    def show_pending_reorders(self, pending_reorders, error):
+        """Fill the reorders list once fetch_pending_reorders completes."""
+        # Clear existing items
+        clear_tree(self.reorders_tree)
+
+        if error:
+            self.reorders_version = None # Try again next time
+            messagebox.showerror("Database Error", f"Error fetching pending reorders: {error}")
+            self.reorders_tree.insert("", "end", values=(f"Error: {error}", "", "", "", "", ""))
+            return
+
+        if not pending_reorders:
+            self.reorders_tree.insert("", "end", values=("No pending reorders.", "", "", "", "", ""))
+        else:
+            # Rows arrive in column order; store necessary data within the item's
+            # values for later retrieval, with reorder_id also the item id (iid)
+            insert_rows(self.reorders_tree, pending_reorders, iid_column=0)
 
 
     def confirm_selected_delivery(self): # Implementation
@@ -458,7 +1351,7 @@ class DashboardFrame(ttk.Frame):
             reorder_id = int(item_values[0])
             upc = item_values[1]
             product_name = item_values[2]
-            quantity_ordered_cases = int(item_values[3])
+            quantity = int(item_values[3]) # reorders.quantity is in units
             case_size = int(item_values[4])
 
         except (ValueError, IndexError) as e:
@@ -469,94 +1362,81 @@ class DashboardFrame(ttk.Frame):
         confirm = messagebox.askyesno("Confirm Delivery",
                                        f"Confirm delivery for Reorder ID {reorder_id}?\n\n"
                                        f"Product: {product_name} (UPC: {upc})\n"
-                                       f"Quantity: {quantity_ordered_cases} cases ({quantity_ordered_cases * case_size} units)")
+                                       f"Quantity: {quantity} units ({quantity // max(case_size, 1)} cases)")
 
         if confirm:
-            # Call the controller method to handle the database updates
-            # We need product_id, which isn't in the tree. The controller method will need it.
-            # Let's pass reorder_id, quantity_ordered_cases, and case_size.
-            # The controller method will look up product_id.
-            success = self.controller.confirm_reorder_delivery(
-                reorder_id,
-                quantity_ordered_cases,
-                case_size
-            )
+            # Disable the button so a second click can't start a second confirmation
+            self.confirm_delivery_button.config(state=tk.DISABLED)
+            self.controller.run_in_background(self.controller.confirm_reorder_delivery,
+                                              partial(self.on_delivery_confirmed, reorder_id),
+                                              reorder_id)
+
+    def on_delivery_confirmed(self, reorder_id, success, error):
+        """Report the outcome of confirm_reorder_delivery and refresh both lists."""
+        self.confirm_delivery_button.config(state=tk.NORMAL)
+        if error:
+            messagebox.showerror("Database Error", f"Error confirming delivery: {error}")
+            return
 
-            if success:
-                messagebox.showinfo("Success", f"Delivery confirmed for reorder {reorder_id}.")
-                # Refresh both lists
-                self.load_pending_reorders()
-                self.load_recent_products() # Refresh products as quantity changed
-            # Else: The confirm_reorder_delivery method in the controller should show error messages
+        # Quantities (or the pending list) changed, so drop the cached recent products
+        # and searches before reloading, or the refresh would be answered from the cache
+        self.controller.invalidate_caches()
+        if success:
+            messagebox.showinfo("Success", f"Delivery confirmed for reorder {reorder_id}.")
+        else:
+            messagebox.showwarning("Not Pending", f"Reorder {reorder_id} is no longer pending; the list will be refreshed.")
+        # Refresh both lists
+        self.load_pending_reorders()
+        self.load_recent_products() # Refresh products as quantity changed
 
-    def open_product_config(self, event=None, product_data=None): # Add product_data argument
-        """Open the configuration screen for the selected product."""
-        product = None
+    def open_product_config(self, event=None, product_data=None, product_id=None): # Add product_data argument
+        """Open the configuration screen for the selected product (or the given product_id)."""
         if product_data:
             # If product data is passed directly (e.g., from search)
-            product = product_data
-            print(f"Opening config directly for product ID: {product.get('product_id')}")
-        elif event:
+            print(f"Opening config directly for product ID: {product_data.get('product_id')}")
+            self.show_product_config(product_data.get('product_id'), product_data, None)
+            return
+
+        if product_id is None:
+            if not event:
+                # Should not happen if called correctly
+                print("Error: open_product_config called without event or product_data.")
+                return
+
             # If called by event (e.g., tree double-click)
             selection = self.products_tree.selection()
             if not selection:
                 return # Nothing selected
 
-            item_id = selection[0]
-            item_values = self.products_tree.item(item_id, "values")
-
-            if not item_values or len(item_values) < 1:
-                 print("Error: Could not get product ID from selected tree item.")
-                 return
-
+            item_values = self.products_tree.item(selection[0], "values")
             try:
                 # Assuming the first column in products_tree is product_id
                 product_id = int(item_values[0])
-                print(f"Opening config from tree selection for product ID: {product_id}")
-
-                # Retrieve the full product data using the product ID
-                if not self.controller.db_connection:
-                     messagebox.showerror("Database Error", "No database connection.")
-                     return
-
-                with self.controller.db_connection.cursor() as cursor:
-                    # Fetch all relevant columns for the config screen
-                    query = """
-                        SELECT product_id, upc, product_name, description, current_quantity,
-                               category, case_size, unit_price
-                        FROM products
-                        WHERE product_id = %s
-                    """
-                    cursor.execute(query, (product_id,))
-                    product = cursor.fetchone() # Fetch as dictionary
-
             except (ValueError, IndexError):
                 messagebox.showerror("Error", "Could not determine product ID from selection.")
                 return
-            except pymysql.MySQLError as e:
-                messagebox.showerror("Database Error", f"Error retrieving product details: {e}")
-                return
-            except Exception as e:
-                 messagebox.showerror("Error", f"An unexpected error occurred: {e}")
-                 return
-        else:
-             # Should not happen if called correctly
-             print("Error: open_product_config called without event or product_data.")
+
+        print(f"Opening config for product ID: {product_id}")
+        # Retrieve the full product data using the product ID
+        if not self.controller.db_connected:
+             messagebox.showerror("Database Error", "No database connection.")
              return
+        # Served from the cache, or fetched on a worker thread
+        self.controller.get_product(product_id, partial(self.show_product_config, product_id))
 
-        # --- Load data into ConfigurationFrame ---
-        if product:
-            # Get the ConfigurationFrame instance
-            config_frame = self.controller.frames.get("ConfigurationFrame")
-            if config_frame:
-                config_frame.load_product(product) # Load data into the config frame
-                self.controller.show_frame("ConfigurationFrame") # Switch view
-            else:
-                messagebox.showerror("Error", "Configuration frame not found.")
-        else:
-             # Only show warning if triggered by event and product not found
-             if event:
-                 messagebox.showwarning("Not Found", f"Product with ID {product_id} not found in database.")
+    def show_product_config(self, product_id, product, error):
+        """Load a fetched product into the ConfigurationFrame and switch to it."""
+        if error:
+            messagebox.showerror("Database Error", f"Error retrieving product details: {error}")
+            return
+        if not product:
+            messagebox.showwarning("Not Found", f"Product with ID {product_id} not found in database.")
+            return
+
+        # Get the ConfigurationFrame instance
+        config_frame = self.controller.get_frame("ConfigurationFrame")
+        config_frame.load_product(product) # Load data into the config frame
+        self.controller.show_frame("ConfigurationFrame") # Switch view
 
     # def open_new_item_window(self): # Implementation
     #     """Opens the modal window to add a new product."""
@@ -565,22 +1445,103 @@ class DashboardFrame(ttk.Frame):
     #     new_item_window = NewItemWindow(self.controller)
     #     new_item_window.grab_set() # Make the new window modal
 
+    def schedule_suggestions(self, event=None):
+        """Refresh the suggestions once a burst of keystrokes has finished."""
+        if event is not None and event.keysym in ("Return", "Up", "Down", "Escape"):
+            return
+        if self.pending_suggestions is not None:
+            self.after_cancel(self.pending_suggestions)
+        self.pending_suggestions = self.after(SUGGESTION_DEBOUNCE_MS, self.update_suggestions)
+
+    def update_suggestions(self):
+        """Offer names and UPCs starting with the typed text, from the local prefix index."""
+        self.pending_suggestions = None
+        index = self.controller.product_index
+        if index is None:
+            return
+        prefix = self.search_var.get().strip()
+        self.search_entry.configure(values=index.suggestions(prefix) if prefix else ())
+
+    def schedule_search(self, event=None):
+        """
+        Debounce Enter-key searches so a burst of presses runs one query.
+
+        Barcode scanners send a complete UPC followed by Enter, so a full
+        length digit string is searched straight away.
+        """
+        if self.pending_search is not None:
+            self.after_cancel(self.pending_search)
+            self.pending_search = None
+
+        search_term = self.search_var.get().strip()
+        if len(search_term) >= SCANNED_UPC_MIN_LENGTH and UPC_PREFIX_RE.fullmatch(search_term):
+            self.perform_search()
+        else:
+            self.pending_search = self.after(SEARCH_DEBOUNCE_MS, self.perform_search)
+
     def perform_search(self, event=None): # This is called by button/entry
         """Perform product search, display results, and handle navigation."""
+        if self.pending_search is not None:
+            # Drop a debounced search still waiting (harmless if this is it firing)
+            self.after_cancel(self.pending_search)
+            self.pending_search = None
         search_term = self.search_var.get().strip() # Use strip()
         if not search_term:
             self.load_recent_products() # Load recent if search is empty
             return
 
-        # Call controller's search method
-        products = self.controller.search_product(search_term)
+        if not self.controller.db_connected:
+            messagebox.showerror("Database Error", "No database connection available.")
+            return
+
+        # Repeated terms are answered from the cache (MySQL matching is case-insensitive)
+        self.search_id += 1
+        cache_key = search_term.lower()
+        cached = self.controller.cache_lookup(self.controller.search_cache, cache_key)
+        if cached is not None:
+            self.show_search_results(self.search_id, cache_key, None, cached, None)
+            return
+
+        # Run the controller's search method on a worker thread
+        self.search_status_var.set("Searching…")
+        self.controller.run_in_background(self.controller.search_product,
+                                          partial(self.show_search_results, self.search_id, cache_key,
+                                                  self.controller.products_version),
+                                          search_term)
+
+    def show_search_results(self, search_id, cache_key, version, products, error):
+        """
+        Display search results once the background search completes.
+
+        Args:
+            search_id (int): self.search_id when the search started
+            cache_key (str): search_cache key for the term
+            version (int | None): controller.products_version when the query
+                started, or None for results already taken from the cache
+            products (tuple): The matching rows
+            error (Exception): The search error, or None
+        """
+        if search_id != self.search_id:
+            return # A newer search has been started since
+        self.search_status_var.set("")
+
+        if error:
+            messagebox.showerror("Database Error", f"Error searching for products: {error}")
+            return
+        if version == self.controller.products_version:
+            # Results from a query that started before invalidate_caches() may
+            # show old quantities, so only current ones are cached
+            self.controller.cache_store(self.controller.search_cache, cache_key, products)
+
+        # The query returns one row past the limit only when more matches exist
+        truncated = len(products) > SEARCH_RESULT_LIMIT
+        products = products[:SEARCH_RESULT_LIMIT]
 
         # Clear the main products tree first
         self.display_products([], is_search=True) # Clear tree, mark as search context
 
         if not products:
-            # Display "No results" in the tree
-            self.products_tree.insert("", "end", values=("", "No results found.", "", ""))
+            # display_products has already put "No results" in the tree
             # Optionally show a messagebox
             # messagebox.showinfo("Search", "No products found matching the search term")
             return
@@ -588,47 +1549,54 @@ class DashboardFrame(ttk.Frame):
         if len(products) == 1:
             # If only one product is found, navigate directly to the configuration frame
             print("Only one product found. Navigating to configuration frame.")
-            # Call the updated open_product_config with the product data
-            self.open_product_config(product_data=products[0])
+            # Search rows only hold the list columns, so load the full product
+            self.open_product_config(product_id=products[0][0])
         else:
             # If multiple products are found, show a selection popup
             print(f"Multiple products found: {len(products)}. Showing selection popup.")
+            if truncated:
+                # Short enough for the fixed-width status label; only the first
+                # SEARCH_RESULT_LIMIT matches are listed
+                self.search_status_var.set(f"{SEARCH_RESULT_LIMIT}+ matches")
             self.show_product_selection_popup(products)
 
     def display_products(self, products, is_search=False):
-        """Clear and populate the main products treeview."""
+        """
+        Clear and populate the main products treeview.
+
+        Args:
+            products (list): (product_id, upc, product_name, current_quantity) rows
+            is_search (bool): Show a "No results" row when products is empty
+        """
         # Find the correct products_tree (ensure it exists and is named self.products_tree)
         if not hasattr(self, 'products_tree'):
              print("Error: products_tree not found in DashboardFrame")
              return
 
-        # Clear existing items
-        for item in self.products_tree.get_children():
-            self.products_tree.delete(item)
-
-        # Insert new items
-        if products:
-            for product in products:
-                # Adjust the values based on the columns in your products_tree
-                self.products_tree.insert("", "end", values=(
-                    product.get('product_id', 'N/A'), # Example column
-                    product.get('upc', 'N/A'),
-                    product.get('product_name', 'N/A'),
-                    product.get('current_quantity', 'N/A')
-                    # Add other columns as needed
-                ))
-        elif is_search:
-             # Optionally show a "No results" message in the tree
-             self.products_tree.insert("", "end", values=("", "No results found.", "", ""))
+        if not products and is_search:
+            # Optionally show a "No results" message in the tree
+            products = [("", "No results found.", "", "")]
+        # Row order already matches the products_tree columns; an unchanged
+        # list (e.g. the same search run again) leaves the tree alone
+        self.products_rows = refill_tree(self.products_tree, products, self.products_rows)
 
     def open_new_item_window(self):
-        """Open a window to add a new product."""
-        NewItemWindow(self.controller)
+        """Open the window to add a new product, reusing it if it was opened before."""
+        window = self.controller.new_item_window
+        if window is not None and window.winfo_exists():
+            # Start from a blank form unless a save from the last visit is still running
+            if str(window.save_button["state"]) != tk.DISABLED:
+                window.reset_fields()
+            window.deiconify()
+            window.lift()
+            return
+        self.controller.new_item_window = NewItemWindow(self.controller)
     
     def on_show(self):
         """Called when this frame is shown."""
-        # Refresh the products list
+        # Refresh the products list, and the reorders if anything changed since
         self.load_recent_products()
+        self.load_pending_reorders(force=False)
     
     # def search_product(self):
     #     """Search for products and display matching results."""
@@ -654,49 +1622,89 @@ class DashboardFrame(ttk.Frame):
     #         self.show_product_selection_popup(products)
     
     def load_recent_products(self):
-        """Load recent products into the treeview."""
+        """Load recent products into the treeview (queried on a worker thread)."""
         print("Attempting to load recent products...") # Debug
-        # Clear existing items
-        for item in self.products_tree.get_children():
-            self.products_tree.delete(item)
-
         # Get recent products from database
-        if not self.controller.db_connection:
+        if not self.controller.db_connected:
             print("DB connection invalid in load_recent_products.") # Debug
+            self.display_products([])
             return
-        try:
-            with self.controller.db_connection.cursor() as cursor:
-                cursor.execute(
-                    "SELECT product_id, upc, product_name, current_quantity FROM products "
-                    "ORDER BY updated_at DESC LIMIT 10"
-                )
-                products = cursor.fetchall()
-                print(f"Found {len(products)} recent products.") # Debug
-                # print(products) # Optional: print the actual data
-
-                # Add products to treeview
-                if not products:
-                     self.products_tree.insert("", "end", values=("No recent products found.", "", "", "")) # Add message if empty
-                else:
-                    for product in products:
-                        self.products_tree.insert("", "end", values=(
-                            product["product_id"],
-                            product["upc"],
-                            product["product_name"],
-                            product["current_quantity"]
-                        ))
-        except pymysql.MySQLError as e:
-            print(f"Database Error in load_recent_products: {e}") # Debug
-            messagebox.showerror("Database Error", f"Error loading products: {e}")
-        except Exception as e:
-             print(f"Unexpected Error in load_recent_products: {e}") # Debug
-             messagebox.showerror("Error", f"An unexpected error occurred loading products: {e}")
+
+        cached = self.controller.recent_products_cache.get("recent")
+        if cached is not None:
+            self.show_recent_products(self.controller.products_version, cached, None)
+            return
+        if self.recent_products_loading:
+            return # Coalesce with the query already running (e.g. rapid frame switches)
+        self.recent_products_loading = True
+        self.controller.run_in_background(self.fetch_recent_products,
+                                          partial(self.show_recent_products, self.controller.products_version))
+
+    def fetch_recent_products(self):
+        """Query the most recently updated products as tuples. Runs on a worker thread."""
+        with self.controller.get_conn() as conn:
+            cursor = db_config.cursor(conn, pymysql.cursors.Cursor)
+            cursor.execute(
+                "SELECT product_id, upc, product_name, current_quantity FROM products "
+                "ORDER BY updated_at DESC LIMIT 10"
+            )
+            return cursor.fetchall()
+
+    def show_recent_products(self, version, products, error):
+        """
+        Fill the treeview with recent products, or report the load error.
+
+        Args:
+            version (int): controller.products_version when the query started
+            products (tuple): The fetched rows
+            error (Exception): The load error, or None
+        """
+        self.recent_products_loading = False
+        if not error and version != self.controller.products_version:
+            # Products changed while the query ran (a reload coalesced into it
+            # would otherwise be lost): discard the stale rows and query again
+            self.load_recent_products()
+            return
+        if error:
+            # Clear existing items
+            self.display_products([])
+
+        if isinstance(error, pymysql.MySQLError):
+            print(f"Database Error in load_recent_products: {error}") # Debug
+            messagebox.showerror("Database Error", f"Error loading products: {error}")
+            return
+        if error:
+            print(f"Unexpected Error in load_recent_products: {error}") # Debug
+            messagebox.showerror("Error", f"An unexpected error occurred loading products: {error}")
+            return
+
+        self.controller.recent_products_cache["recent"] = products
+        print(f"Found {len(products)} recent products.") # Debug
+        # print(products) # Optional: print the actual data
+
+        # Add products to treeview (a cache hit is the same list, so no Tk calls at all)
+        if not products:
+            products = [("No recent products found.", "", "", "")] # Add message if empty
+        self.display_products(products)
     
     def show_product_selection_popup(self, products):
-        """Show a popup window to select a product from the search results."""
+        """
+        Show a popup window to select a product from the search results.
+
+        The popup is built on first use and then kept: closing it only
+        hides it, and later searches refill its tree and show it again.
+        """
+        popup = self.selection_popup
+        if popup is not None and popup.winfo_exists():
+            self.selection_rows = refill_tree(self.selection_tree, products, self.selection_rows)
+            popup.deiconify()
+            popup.lift()
+            return
+
         popup = tk.Toplevel(self)
         popup.title("Select a Product")
         popup.geometry("600x400")  # Set a larger default size for the popup window
+        popup.protocol("WM_DELETE_WINDOW", popup.withdraw) # Hide rather than destroy
         
         # Add a label
         label = ttk.Label(popup, text="Select a product from the list below:")
@@ -714,14 +1722,8 @@ class DashboardFrame(ttk.Frame):
         tree.column("Name", width=300)
         tree.column("Quantity", width=100)
         
-        # Add products to the treeview
-        for product in products:
-            tree.insert("", "end", values=(
-                product["product_id"],
-                product["upc"],
-                product["product_name"],
-                product["current_quantity"]
-            ))
+        # Add products to the treeview (search rows match the tree columns)
+        self.selection_rows = refill_tree(tree, products, None)
         
         tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
@@ -729,54 +1731,25 @@ class DashboardFrame(ttk.Frame):
         select_button = ttk.Button(popup, text="Select", command=lambda: self.select_product_from_popup(tree, popup))
         select_button.pack(pady=10)
 
+        self.selection_popup = popup
+        self.selection_tree = tree
+
     def select_product_from_popup(self, tree, popup):
-        """Handle product selection from the popup."""
+        """Handle product selection from the popup (hidden for reuse, not destroyed)."""
         selection = tree.selection()
         if not selection:
             messagebox.showinfo("Selection", "Please select a product")
             return
 
-        item = tree.item(selection[0])
         try:
-            product_id = int(item["values"][0]) # Get the product ID
+            product_id = int(tree.item(selection[0], "values")[0]) # Get the product ID
         except (ValueError, IndexError):
              messagebox.showerror("Error", "Could not get product ID from popup selection.")
-             popup.destroy() # Close popup on error
+             popup.withdraw() # Close popup on error
              return
-        # Retrieve the full product data using the product ID
-        product = None
-        try:
-            if not self.controller.db_connection:
-                 messagebox.showerror("Database Error", "No database connection.")
-                 popup.destroy()
-                 return
-
-            with self.controller.db_connection.cursor() as cursor:
-                query = """
-                    SELECT product_id, upc, product_name, description, current_quantity,
-                           category, case_size, unit_price
-                    FROM products
-                    WHERE product_id = %s
-                """
-                cursor.execute(query, (product_id,))
-                product = cursor.fetchone()
-        except pymysql.MySQLError as e:
-            messagebox.showerror("Database Error", f"Error retrieving product: {e}")
-            popup.destroy()
-            return
-        except Exception as e:
-             messagebox.showerror("Error", f"An unexpected error occurred retrieving product: {e}")
-             popup.destroy()
-             return
-
-        # Close the popup BEFORE trying to open the config frame
-        popup.destroy()
-
-        if product:
-            # Call the updated open_product_config with the retrieved data
-            self.open_product_config(product_data=product)
-        else:
-             messagebox.showwarning("Not Found", f"Selected product (ID: {product_id}) not found in database.")
+        # Close the popup BEFORE opening the config frame, which fetches the full product
+        popup.withdraw()
+        self.open_product_config(product_id=product_id)
 
     # def open_product_config(self, product):
     #     """Open the configuration screen for the selected product."""
@@ -812,70 +1785,48 @@ class ConfigurationFrame(ttk.Frame):
         self.product_frame = ttk.Frame(self)
         self.product_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        # Create input fields with labels
-        # Product ID (read-only)
-        id_frame = ttk.Frame(self.product_frame)
-        id_frame.pack(fill=tk.X, pady=5)
+        # Create input fields with labels, one grid row per field
+        self.product_frame.grid_columnconfigure(1, weight=1)
         
-        ttk.Label(id_frame, text="Product ID:", width=15).pack(side=tk.LEFT)
+        # Product ID (read-only)
+        ttk.Label(self.product_frame, text="Product ID:", width=15).grid(row=0, column=0, sticky="w", pady=5)
         self.id_var = tk.StringVar()
-        ttk.Entry(id_frame, textvariable=self.id_var, state="readonly", width=30).pack(side=tk.LEFT)
+        ttk.Entry(self.product_frame, textvariable=self.id_var, state="readonly", width=30).grid(row=0, column=1, sticky="w", pady=5)
         
         # UPC/Barcode (read-only)
-        upc_frame = ttk.Frame(self.product_frame)
-        upc_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(upc_frame, text="UPC:", width=15).pack(side=tk.LEFT)
+        ttk.Label(self.product_frame, text="UPC:", width=15).grid(row=1, column=0, sticky="w", pady=5)
         self.upc_var = tk.StringVar()
-        ttk.Entry(upc_frame, textvariable=self.upc_var, state="readonly", width=30).pack(side=tk.LEFT)
+        ttk.Entry(self.product_frame, textvariable=self.upc_var, state="readonly", width=30).grid(row=1, column=1, sticky="w", pady=5)
         
         # Product Name
-        name_frame = ttk.Frame(self.product_frame)
-        name_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(name_frame, text="Product Name:", width=15).pack(side=tk.LEFT)
+        ttk.Label(self.product_frame, text="Product Name:", width=15).grid(row=2, column=0, sticky="w", pady=5)
         self.name_var = tk.StringVar()
-        ttk.Entry(name_frame, textvariable=self.name_var, width=50).pack(side=tk.LEFT)
+        ttk.Entry(self.product_frame, textvariable=self.name_var, width=50).grid(row=2, column=1, sticky="w", pady=5)
         
         # Description
-        desc_frame = ttk.Frame(self.product_frame)
-        desc_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(desc_frame, text="Description:", width=15).pack(side=tk.LEFT, anchor=tk.N)
-        self.desc_text = tk.Text(desc_frame, height=3, width=50)
-        self.desc_text.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Label(self.product_frame, text="Description:", width=15).grid(row=3, column=0, sticky="nw", pady=5)
+        self.desc_text = tk.Text(self.product_frame, height=3, width=50)
+        self.desc_text.grid(row=3, column=1, sticky="ew", pady=5)
         
         # Category
-        category_frame = ttk.Frame(self.product_frame)
-        category_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(category_frame, text="Category:", width=15).pack(side=tk.LEFT)
+        ttk.Label(self.product_frame, text="Category:", width=15).grid(row=4, column=0, sticky="w", pady=5)
         self.category_var = tk.StringVar()
-        ttk.Entry(category_frame, textvariable=self.category_var, width=30).pack(side=tk.LEFT)
+        ttk.Entry(self.product_frame, textvariable=self.category_var, width=30).grid(row=4, column=1, sticky="w", pady=5)
         
         # Current Quantity
-        qty_frame = ttk.Frame(self.product_frame)
-        qty_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(qty_frame, text="Current Quantity:", width=15).pack(side=tk.LEFT)
+        ttk.Label(self.product_frame, text="Current Quantity:", width=15).grid(row=5, column=0, sticky="w", pady=5)
         self.qty_var = tk.StringVar()
-        ttk.Entry(qty_frame, textvariable=self.qty_var, width=10).pack(side=tk.LEFT)
+        ttk.Entry(self.product_frame, textvariable=self.qty_var, width=10).grid(row=5, column=1, sticky="w", pady=5)
         
         # Case Size
-        case_size_frame = ttk.Frame(self.product_frame)
-        case_size_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(case_size_frame, text="Case Size:", width=15).pack(side=tk.LEFT)
+        ttk.Label(self.product_frame, text="Case Size:", width=15).grid(row=6, column=0, sticky="w", pady=5)
         self.case_size_var = tk.StringVar()
-        ttk.Entry(case_size_frame, textvariable=self.case_size_var, width=10).pack(side=tk.LEFT)
+        ttk.Entry(self.product_frame, textvariable=self.case_size_var, width=10).grid(row=6, column=1, sticky="w", pady=5)
         
         # Unit Price
-        price_frame = ttk.Frame(self.product_frame)
-        price_frame.pack(fill=tk.X, pady=5)
-        
-        ttk.Label(price_frame, text="Unit Price ($):", width=15).pack(side=tk.LEFT)
+        ttk.Label(self.product_frame, text="Unit Price ($):", width=15).grid(row=7, column=0, sticky="w", pady=5)
         self.price_var = tk.StringVar()
-        ttk.Entry(price_frame, textvariable=self.price_var, width=10).pack(side=tk.LEFT)
+        ttk.Entry(self.product_frame, textvariable=self.price_var, width=10).grid(row=7, column=1, sticky="w", pady=5)
         
         # Buttons frame
         buttons_frame = ttk.Frame(self)
@@ -915,8 +1866,8 @@ class ConfigurationFrame(ttk.Frame):
             case_size = int(self.case_size_var.get())
             unit_price = float(self.price_var.get())
             
-            if current_quantity < 0 or case_size < 1 or unit_price < 0:
-                raise ValueError("Values cannot be negative and case size must be at least 1")
+            if current_quantity < 0 or case_size < 1 or not math.isfinite(unit_price) or unit_price < 0:
+                raise ValueError("Values cannot be negative, unit price must be finite and case size must be at least 1")
                 
         except ValueError as e:
             messagebox.showerror("Input Error", f"Invalid numeric input: {e}")
@@ -932,13 +1883,27 @@ class ConfigurationFrame(ttk.Frame):
             "unit_price": unit_price
         }
         
-        # Update product
-        success = self.controller.update_product(self.current_product["product_id"], product_data)
+        if not self.controller.db_connected:
+            messagebox.showerror("Database Error", "No database connection available.")
+            return
         
-        if success:
-            messagebox.showinfo("Success", "Product updated successfully")
-            # Update the current product with new values
-            self.current_product.update(product_data)
+        # Update product on a worker thread; the button stays disabled until it finishes
+        self.save_button.config(state=tk.DISABLED)
+        self.controller.run_in_background(self.controller.update_product,
+                                          partial(self.on_product_saved, self.current_product, product_data),
+                                          self.current_product["product_id"], product_data)
+    
+    def on_product_saved(self, product, product_data, result, error):
+        """Report the outcome of save_product (runs on the Tk thread)."""
+        self.save_button.config(state=tk.NORMAL)
+        if error:
+            messagebox.showerror("Database Error", f"Error updating product: {error}")
+            return
+        
+        self.controller.product_updated(product["product_id"], product_data)
+        messagebox.showinfo("Success", "Product updated successfully")
+        # Update the saved product with new values (the form may show another one by now)
+        product.update(product_data)
 
 class ReportsFrame(ttk.Frame):
     """Frame for listing and processing sales report files.""" # Updated docstring
@@ -996,51 +1961,72 @@ class ReportsFrame(ttk.Frame):
         buttons_frame = ttk.Frame(self)
         buttons_frame.pack(fill=tk.X, pady=(20, 0))
 
-        process_button = ttk.Button(buttons_frame, text="Process Selected Sales File", # Updated button text
+        self.process_button = ttk.Button(buttons_frame, text="Process Selected Sales File", # Updated button text
                                command=self.process_selected_sales_file) # Updated command and method name
-        process_button.pack(side=tk.RIGHT)
+        self.process_button.pack(side=tk.RIGHT)
+        self.status_var = tk.StringVar()
+        ttk.Label(buttons_frame, textvariable=self.status_var).pack(side=tk.RIGHT, padx=10)
 
-        # Load sales files when showing this frame
-        self.load_sales_files() # Renamed method
+        # Directory mtime the file list was last built from (None = not loaded);
+        # on_show builds the list when the frame is first shown
+        self.sales_files_version = None
 
     def on_show(self):
         """Called when this frame is shown."""
-        # Refresh the sales files list
-        self.load_sales_files() # Renamed method
+        # Refresh the sales files list if files were added, removed or renamed
+        self.load_sales_files(force=False) # Renamed method
 
-    def load_sales_files(self): # Renamed method
-        """Load sales report files from the directory into the treeview."""
-        # Clear existing items
-        for item in self.files_tree.get_children():
-            self.files_tree.delete(item)
+    def load_sales_files(self, force=True): # Renamed method
+        """
+        Load sales report files from the directory into the treeview (scanned on a worker thread).
 
+        Args:
+            force (bool): Rescan even if the directory has not changed since
+                the list was last built
+        """
         try:
-            # Ensure the directory exists
-            if not os.path.isdir(SALES_REPORTS_DIR): # Use new constant
-                messagebox.showwarning("Directory Not Found", f"The directory {SALES_REPORTS_DIR} does not exist.") # Use new constant
-                return
+            version = os.stat(SALES_REPORTS_DIR).st_mtime_ns
+        except OSError:
+            version = None # Missing directory, let the scan report it
+        if not force and version is not None and version == self.sales_files_version:
+            return # Directory unchanged, the list is accurate or a scan of it is running
+        # Claimed now rather than when the scan finishes, so showing the frame
+        # again meanwhile does not start a second scan (a failed scan clears it)
+        self.sales_files_version = version
+        self.controller.run_in_background(self.scan_sales_files, partial(self.show_sales_files, version))
+
+    def scan_sales_files(self):
+        """
+        List the sales files, newest first. Runs on a worker thread.
 
-            # List files in the directory
-            files = [f for f in os.listdir(SALES_REPORTS_DIR) if os.path.isfile(os.path.join(SALES_REPORTS_DIR, f)) and f.endswith('.txt')] # Use new constant
+        Returns:
+            list[tuple] | None: (filename, mod_time_str, file_path) per file,
+            or None if the sales reports directory does not exist
+        """
+        # List files in the directory, newest first (the scan itself tells us
+        # if the directory is missing, so it is not stat()ed separately)
+        try:
+            return list_text_files(SALES_REPORTS_DIR) # Use new constant
+        except (FileNotFoundError, NotADirectoryError):
+            return None
 
-            # Sort files by modification time, newest first
-            files.sort(key=lambda f: os.path.getmtime(os.path.join(SALES_REPORTS_DIR, f)), reverse=True) # Use new constant
+    def show_sales_files(self, version, entries, error):
+        """Fill the treeview with the scanned sales files, or report the error."""
+        # Clear existing items
+        clear_tree(self.files_tree)
+        self.sales_files_version = None
 
-            # Add files to treeview
-            for filename in files:
-                file_path = os.path.join(SALES_REPORTS_DIR, filename) # Use new constant
-                try:
-                    mod_time_timestamp = os.path.getmtime(file_path)
-                    mod_time_str = datetime.fromtimestamp(mod_time_timestamp).strftime('%Y-%m-%d %H:%M:%S')
-                except OSError:
-                    mod_time_str = "N/A" # Handle potential errors getting mod time
+        if error:
+            messagebox.showerror("Error Loading Files", f"An error occurred while loading sales files: {error}") # Updated message
+            return
+        if entries is None:
+            messagebox.showwarning("Directory Not Found", f"The directory {SALES_REPORTS_DIR} does not exist.") # Use new constant
+            return
 
-                self.files_tree.insert("", "end", values=(
-                    filename,
-                    mod_time_str
-                ), tags=(file_path,)) # Store full path in tags
-        except Exception as e:
-            messagebox.showerror("Error Loading Files", f"An error occurred while loading sales files: {e}") # Updated message
+        # Add files to treeview; only the first two values are shown, and the
+        # full path is stored in tags
+        insert_rows(self.files_tree, entries, tag_column=2)
+        self.sales_files_version = version
 
 
     def process_selected_sales_file(self): # Renamed method
@@ -1070,42 +2056,42 @@ class ReportsFrame(ttk.Frame):
         self.run_reorder_script(file_path) # Keep using this method
 
     def run_reorder_script(self, file_path): # No changes needed here, it takes the file path correctly
-        """Run the reorder_generator.py script with the selected file."""
-        script_path = os.path.join(os.path.dirname(__file__), "reorder_generator.py")
-        command = [sys.executable, script_path, file_path]
-
-        try:
-            # Check if script exists
-            if not os.path.exists(script_path):
-                 messagebox.showerror("Error", f"Script not found: {script_path}")
-                 return
-
-            print(f"Running command: {' '.join(command)}")
-            # Run the script and capture output
-            result = subprocess.run(command, capture_output=True, text=True, check=True, cwd=os.path.dirname(script_path))
-
-            # Display success message and output
-            output_message = f"Successfully processed sales file {os.path.basename(file_path)}.\n\nOutput:\n{result.stdout}" # Updated message
-            messagebox.showinfo("Processing Complete", output_message)
-
-            # Refresh the dashboard as inventory and reorders might have changed
-            dashboard_frame = self.controller.frames.get("DashboardFrame")
-            if dashboard_frame:
-                # Check if the specific methods exist before calling
-                if hasattr(dashboard_frame, 'load_recent_products'):
-                    dashboard_frame.load_recent_products()
-                if hasattr(dashboard_frame, 'load_pending_reorders'):
-                    dashboard_frame.load_pending_reorders()
-
+        """Run reorder_generator on the selected file (in-process, on a worker thread)."""
+        if str(self.process_button["state"]) == tk.DISABLED:
+            return # A file is still being processed (e.g. a double-click during the run)
+
+        print(f"Running reorder generator on: {file_path}")
+        # Run the generator off the Tk thread; the button stays disabled until it finishes.
+        # It is imported once with the app, so no Python interpreter is started per file.
+        self.process_button.config(state=tk.DISABLED)
+        self.status_var.set(f"Processing {os.path.basename(file_path)}…")
+        self.controller.run_in_background(run_reorder_generator,
+                                          partial(self.on_reorder_script_done, file_path),
+                                          file_path)
+
+    def on_reorder_script_done(self, file_path, result, error):
+        """Report the outcome of run_reorder_script (runs on the Tk thread)."""
+        self.process_button.config(state=tk.NORMAL)
+        self.status_var.set("")
+
+        if error:
+            messagebox.showerror("Error", f"An unexpected error occurred while running the script: {error}")
+            return
 
-        except FileNotFoundError:
-            messagebox.showerror("Error", f"Could not find Python executable or script: {command[0]}")
-        except subprocess.CalledProcessError as e:
+        status, output = result
+        if status:
             # Display error message and output
-            error_message = f"Error processing sales file {os.path.basename(file_path)}.\n\nExit Code: {e.returncode}\n\nError Output:\n{e.stderr}\n\nStandard Output:\n{e.stdout}" # Updated message
+            error_message = f"Error processing sales file {os.path.basename(file_path)}.\n\nExit Code: {status}\n\nOutput:\n{output}" # Updated message
             messagebox.showerror("Processing Error", error_message)
-        except Exception as e:
-            messagebox.showerror("Error", f"An unexpected error occurred while running the script: {e}")
+            # A failed run may still have committed the inventory update
+            self.controller.invalidate_caches()
+        else:
+            # Inventory and reorders might have changed; the dashboard
+            # reloads its lists when it is shown again
+            self.controller.invalidate_caches()
+            # Display success message and output
+            output_message = f"Successfully processed sales file {os.path.basename(file_path)}.\n\nOutput:\n{output}" # Updated message
+            messagebox.showinfo("Processing Complete", output_message)
 
 class ConfirmOrderFrame(ttk.Frame):
     """Frame for confirming received orders by processing a reorder file."""
@@ -1162,53 +2148,73 @@ class ConfirmOrderFrame(ttk.Frame):
         buttons_frame = ttk.Frame(self)
         buttons_frame.pack(fill=tk.X, pady=(20, 0))
 
-        confirm_button = ttk.Button(buttons_frame, text="Confirm Selected Order File",
-                               command=self.process_selected_order_file)
-        confirm_button.pack(side=tk.RIGHT)
+        self.confirm_button = ttk.Button(buttons_frame, text="Confirm Selected Order File",
+                                         command=self.process_selected_order_file)
+        self.confirm_button.pack(side=tk.RIGHT)
+        self.status_var = tk.StringVar()
+        ttk.Label(buttons_frame, textvariable=self.status_var).pack(side=tk.RIGHT, padx=10)
 
-        # Load files on initialization
-        self.load_reorder_files()
+        # Directory mtime the file list was last built from (None = not loaded);
+        # on_show builds the list when the frame is first shown
+        self.reorder_files_version = None
 
     def on_show(self):
         """Called when this frame is shown."""
-        self.load_reorder_files() # Refresh the list when shown
+        # Refresh the list if reorder files were added, removed or renamed
+        self.load_reorder_files(force=False)
 
-    def load_reorder_files(self):
-        """Load reorder list files from the directory into the treeview."""
-        # Clear existing items
-        for item in self.files_tree.get_children():
-            self.files_tree.delete(item)
+    def load_reorder_files(self, force=True):
+        """
+        Load reorder list files from the directory into the treeview.
 
+        Args:
+            force (bool): Rescan even if the directory has not changed since
+                the list was last built
+        """
         try:
-            # Ensure the directory exists
-            if not os.path.isdir(REORDER_LISTS_DIR):
-                messagebox.showwarning("Directory Not Found", f"The directory {REORDER_LISTS_DIR} does not exist.")
-                return
+            version = os.stat(REORDER_LISTS_DIR).st_mtime_ns
+        except OSError:
+            version = None # Missing directory, reported below
+        if not force and version is not None and version == self.reorder_files_version:
+            return # Directory unchanged, the list is accurate or a scan of it is running
+        # Claimed now rather than when the scan finishes, so showing the frame
+        # again meanwhile does not start a second scan (a failed scan clears it)
+        self.reorder_files_version = version
+        self.controller.run_in_background(self.scan_reorder_files, partial(self.show_reorder_files, version))
+
+    def scan_reorder_files(self):
+        """
+        List the reorder files, newest first. Runs on a worker thread.
 
-            # List files in the directory (assuming .txt, adjust if needed)
-            files = [f for f in os.listdir(REORDER_LISTS_DIR) if os.path.isfile(os.path.join(REORDER_LISTS_DIR, f)) and f.endswith('.txt')]
+        Returns:
+            list[tuple] | None: (filename, mod_time_str, file_path) per file,
+            or None if the reorder lists directory does not exist
+        """
+        try:
+            return list_text_files(REORDER_LISTS_DIR)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
 
-            # Sort files by modification time, newest first
-            files.sort(key=lambda f: os.path.getmtime(os.path.join(REORDER_LISTS_DIR, f)), reverse=True)
+    def show_reorder_files(self, version, files, error):
+        """Fill the treeview with the scanned reorder files, or report the error."""
+        # Clear existing items
+        clear_tree(self.files_tree)
+        self.reorder_files_version = None
 
-            # Add files to treeview
-            if not files:
-                 self.files_tree.insert("", "end", values=("No reorder files found.", ""))
-            else:
-                for filename in files:
-                    file_path = os.path.join(REORDER_LISTS_DIR, filename)
-                    try:
-                        mod_time_timestamp = os.path.getmtime(file_path)
-                        mod_time_str = datetime.fromtimestamp(mod_time_timestamp).strftime('%Y-%m-%d %H:%M:%S')
-                    except OSError:
-                        mod_time_str = "N/A"
-
-                    self.files_tree.insert("", "end", values=(
-                        filename,
-                        mod_time_str
-                    ), tags=(file_path,)) # Store full path in tags
-        except Exception as e:
-            messagebox.showerror("Error Loading Files", f"An error occurred while loading reorder files: {e}")
+        if error:
+            messagebox.showerror("Error Loading Files", f"An error occurred while loading reorder files: {error}")
+            return
+        if files is None:
+            messagebox.showwarning("Directory Not Found", f"The directory {REORDER_LISTS_DIR} does not exist.")
+            return
+
+        # Add files to treeview
+        if not files:
+             self.files_tree.insert("", "end", values=("No reorder files found.", ""))
+        else:
+            # Only the first two values are shown; the full path is stored in tags
+            insert_rows(self.files_tree, files, tag_column=2)
+        self.reorder_files_version = version
 
     def process_selected_order_file(self):
         """Process the selected reorder file to update inventory."""
@@ -1225,18 +2231,27 @@ class ConfirmOrderFrame(ttk.Frame):
                                       "This will read UPCs from the file, assume each line represents ONE CASE received, "
                                       "and increase the product quantity accordingly.")
         if confirm:
-            success, message = self.controller.confirm_order_from_file(file_path)
-            if success:
-                messagebox.showinfo("Update Complete", message)
-                # Refresh dashboard lists
-                dashboard_frame = self.controller.frames.get("DashboardFrame")
-                if dashboard_frame:
-                    if hasattr(dashboard_frame, 'load_recent_products'):
-                        dashboard_frame.load_recent_products()
-                    if hasattr(dashboard_frame, 'load_pending_reorders'):
-                        dashboard_frame.load_pending_reorders() # Also refresh pending orders
-            else:
-                messagebox.showerror("Update Failed", message)
+            # Update on a worker thread; the button stays disabled until it finishes
+            self.confirm_button.config(state=tk.DISABLED)
+            self.status_var.set(f"Updating inventory from {filename}…")
+            self.controller.run_in_background(self.controller.confirm_order_from_file,
+                                              self.on_order_file_processed, file_path)
+
+    def on_order_file_processed(self, result, error):
+        """Report the outcome of process_selected_order_file (runs on the Tk thread)."""
+        self.confirm_button.config(state=tk.NORMAL)
+        self.status_var.set("")
+        if error:
+            messagebox.showerror("Update Failed", f"An unexpected error occurred: {error}")
+            return
+
+        success, message = result
+        if success:
+            # The dashboard reloads its lists when it is shown again
+            self.controller.invalidate_caches()
+            messagebox.showinfo("Update Complete", message)
+        else:
+            messagebox.showerror("Update Failed", message)
 
     def process_selected_order_file_event(self, event):
         """Handle double-click on a reorder file item."""
@@ -1259,85 +2274,251 @@ class NewItemWindow(tk.Toplevel):
         super().__init__()
         self.controller = controller
         self.title("Enter New Item")
-        self.geometry("400x400")
+        self.geometry("400x360")
+        # Closing only hides the window so it can be shown again without rebuilding
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
         
-        # Create input fields for product details
-        ttk.Label(self, text="UPC:").pack(pady=5, anchor=tk.W)
-        self.upc_var = tk.StringVar()
-        ttk.Entry(self, textvariable=self.upc_var).pack(fill=tk.X, padx=10)
+        # Create input fields for product details, laid out once in a grid
+        form_frame = ttk.Frame(self, padding=10)
+        form_frame.pack(fill=tk.X)
+        form_frame.columnconfigure(1, weight=1)
         
-        ttk.Label(self, text="Product Name:").pack(pady=5, anchor=tk.W)
-        self.name_var = tk.StringVar()
-        ttk.Entry(self, textvariable=self.name_var).pack(fill=tk.X, padx=10)
+        # Entries are read directly with get(); no Tcl variable sits behind them
+        self.entries = {}
+        for row, (label, column, _, _) in enumerate(NEW_PRODUCT_FIELDS):
+            ttk.Label(form_frame, text=label + ":").grid(row=row, column=0, sticky="w", pady=5)
+            if column == "category":
+                # Offer the categories already in use; new ones can still be typed
+                entry = ttk.Combobox(form_frame, postcommand=self.update_category_values)
+            else:
+                entry = ttk.Entry(form_frame)
+            entry.grid(row=row, column=1, sticky="ew", pady=5)
+            self.entries[column] = entry
+        self.reset_fields()
         
-        ttk.Label(self, text="Description:").pack(pady=5, anchor=tk.W)
-        self.desc_var = tk.StringVar()
-        ttk.Entry(self, textvariable=self.desc_var).pack(fill=tk.X, padx=10)
+        # Add Save button
+        self.save_button = ttk.Button(self, text="Save", command=self.save_new_item)
+        self.save_button.pack(pady=(10, 5))
         
-        ttk.Label(self, text="Category:").pack(pady=5, anchor=tk.W)
-        self.category_var = tk.StringVar()
-        ttk.Entry(self, textvariable=self.category_var).pack(fill=tk.X, padx=10)
+        # Batch entry: queue several items, then insert them all at once
+        batch_frame = ttk.Frame(self)
+        batch_frame.pack(pady=5)
+        # Add and Save Batch are disabled while a batch save runs, so the batch can't change under it
+        self.add_batch_button = ttk.Button(batch_frame, text="Add to Batch", command=self.add_to_batch)
+        self.add_batch_button.pack(side=tk.LEFT, padx=5)
+        self.save_batch_button = ttk.Button(batch_frame, text="Save Batch", command=self.save_batch)
+        self.save_batch_button.pack(side=tk.LEFT, padx=5)
+        self.import_button = ttk.Button(batch_frame, text="Import CSV...", command=self.import_csv)
+        self.import_button.pack(side=tk.LEFT, padx=5)
+        self.batch_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.batch_var).pack()
+        self.update_batch_label()
+    
+    def reset_fields(self):
+        """Clear the form back to its defaults for the next item."""
+        for _, column, _, default in NEW_PRODUCT_FIELDS:
+            entry = self.entries[column]
+            entry.delete(0, tk.END)
+            entry.insert(0, default)
+    
+    def update_category_values(self):
+        """Fill the category dropdown from the controller's cached list as it opens."""
+        self.entries["category"].configure(values=self.controller.categories)
+    
+    def update_batch_label(self):
+        """Show how many items are waiting in the batch."""
+        count = len(self.controller.pending_products)
+        self.batch_var.set(f"{count} item(s) waiting in batch" if count else "")
+    
+    def collect_product_data(self):
+        """
+        Read and validate the form.
         
-        ttk.Label(self, text="Current Quantity:").pack(pady=5, anchor=tk.W)
-        self.qty_var = tk.IntVar()
-        ttk.Entry(self, textvariable=self.qty_var).pack(fill=tk.X, padx=10)
+        The entry text is parsed by parse_product_fields(), so bad input is
+        reported before any database connection is borrowed.
         
-        ttk.Label(self, text="Case Size:").pack(pady=5, anchor=tk.W)
-        self.case_size_var = tk.IntVar(value=1)  # Default case size is 1
-        ttk.Entry(self, textvariable=self.case_size_var).pack(fill=tk.X, padx=10)
+        Returns:
+            dict | None: The product fields, or None if validation failed
+            (an error has already been shown)
+        """
+        try:
+            return parse_product_fields({column: entry.get() for column, entry in self.entries.items()})
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return None
+    
+    def add_to_batch(self):
+        """Validate the form and queue the item for the next batch save."""
+        product_data = self.collect_product_data()
+        if product_data is None:
+            return
+        # One row per UPC: the batch upsert would merge duplicates into one
+        # product, and the saved counts would no longer add up
+        if any(row[0] == product_data["upc"] for row in self.controller.pending_products):
+            messagebox.showerror("Input Error", f"UPC {product_data['upc']} is already in the batch.")
+            return
         
-        ttk.Label(self, text="Unit Price ($):").pack(pady=5, anchor=tk.W)
-        self.price_var = tk.DoubleVar()
-        ttk.Entry(self, textvariable=self.price_var).pack(fill=tk.X, padx=10)
+        self.controller.pending_products.append(
+            tuple(product_data[column] for column in NEW_PRODUCT_COLUMNS))
+        self.reset_fields()
+        self.update_batch_label()
+    
+    def save_batch(self):
+        """Insert every queued item in one transaction, on worker threads."""
+        rows = self.controller.pending_products
+        if not rows:
+            messagebox.showinfo("Save Batch", "There are no items in the batch.")
+            return
         
-        # Add Save button
-        save_button = ttk.Button(self, text="Save", command=self.save_new_item)
-        save_button.pack(pady=20)
+        # Look up existing UPCs first, so the user can decide before anything is written
+        self.set_batch_buttons(tk.DISABLED)
+        self.controller.run_in_background(self.controller.existing_upcs, self.on_existing_upcs_found,
+                                          [row[0] for row in rows])
     
-    def save_new_item(self):
-        """Save the new product to the database."""
-        # Get input values
-        product_data = {
-            "upc": self.upc_var.get(),
-            "product_name": self.name_var.get(),
-            "description": self.desc_var.get(),
-            "category": self.category_var.get(),
-            "current_quantity": self.qty_var.get(),
-            "case_size": self.case_size_var.get(),
-            "unit_price": self.price_var.get()
-        }
+    def set_batch_buttons(self, state):
+        """Enable or disable the Add to Batch and Save Batch buttons."""
+        self.add_batch_button.config(state=state)
+        self.save_batch_button.config(state=state)
+    
+    def on_existing_upcs_found(self, existing, error):
+        """Confirm overwrites for the batch, then start the insert (runs on the Tk thread)."""
+        if error is not None:
+            self.set_batch_buttons(tk.NORMAL)
+            messagebox.showerror("Database Error", f"Error adding products (the batch was kept): {error}")
+            return
         
-        # Validate inputs
-        if not product_data["upc"] or not product_data["product_name"]:
-            messagebox.showerror("Input Error", "UPC and Product Name are required.")
+        rows = self.controller.pending_products
+        to_save = rows
+        if existing:
+            # Ask before overwriting the details of products that already exist
+            answer = messagebox.askyesnocancel(
+                "UPCs Already Exist",
+                f"{len(existing)} item(s) in the batch have a UPC that already exists:\n"
+                f"{', '.join(sorted(existing))}\n\n"
+                "Yes: update those products' details (their quantity on hand is kept).\n"
+                "No: save only the new products.\n"
+                "Cancel: save nothing and keep the batch.")
+            if answer is None:
+                self.set_batch_buttons(tk.NORMAL)
+                return
+            if not answer:
+                to_save = [row for row in rows if row[0] not in existing]
+        if not to_save:
+            self.on_batch_saved(existing, to_save, None, None)
+            return
+        self.controller.run_in_background(self.controller.insert_products,
+                                          partial(self.on_batch_saved, existing, to_save), to_save)
+    
+    def on_batch_saved(self, existing, to_save, result, error):
+        """Report the outcome of save_batch (runs on the Tk thread)."""
+        self.set_batch_buttons(tk.NORMAL)
+        if error is not None:
+            messagebox.showerror("Database Error", f"Error adding products (the batch was kept): {error}")
+            return
+        
+        rows = self.controller.pending_products
+        added = sum(1 for row in to_save if row[0] not in existing)
+        updated = len(to_save) - added
+        skipped = len(rows) - len(to_save)
+        rows.clear()
+        self.update_batch_label()
+        self.controller.invalidate_caches()
+        # Re-read the suggestion index and categories so the new products are included
+        self.controller.reload_product_lookups()
+        message = f"{added} product(s) added."
+        if updated:
+            message += f" {updated} existing product(s) updated (quantities kept)."
+        if skipped:
+            message += f" {skipped} item(s) with an existing UPC were skipped."
+        messagebox.showinfo("Success", message)
+    
+    def import_csv(self):
+        """Choose a CSV file of new products and bulk load it on a worker thread."""
+        path = filedialog.askopenfilename(
+            parent=self,
+            title="Import Products",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        # Block a second import until this load has finished
+        self.import_button.config(state=tk.DISABLED)
+        self.controller.run_in_background(self.controller.import_products_csv,
+                                          self.on_csv_imported, path)
+    
+    def on_csv_imported(self, counts, error):
+        """Report the outcome of import_csv (runs on the Tk thread)."""
+        self.import_button.config(state=tk.NORMAL)
+        if isinstance(error, (ValueError, OSError)):
+            messagebox.showerror("Import Error", f"Error reading the CSV file: {error}")
+            return
+        if error is not None:
+            messagebox.showerror("Database Error", f"Error importing products: {error}")
             return
         
-        if product_data["case_size"] < 1:
-            messagebox.showerror("Input Error", "Case size must be at least 1.")
+        loaded, total, duplicates, warnings = counts
+        self.controller.invalidate_caches()
+        # Re-read the suggestion index and categories so the new products are included
+        self.controller.reload_product_lookups()
+        message = f"{loaded} of {total} product(s) imported."
+        if duplicates:
+            message += f" {duplicates} row(s) were skipped because the UPC already exists or repeats an earlier row."
+        other_skipped = total - loaded - duplicates
+        if other_skipped > 0:
+            message += f" {other_skipped} other row(s) were skipped."
+        if warnings:
+            message += "\n\nServer warnings:\n" + "\n".join(warnings[:5])
+            if len(warnings) > 5:
+                message += f"\n…and {len(warnings) - 5} more."
+        messagebox.showinfo("Import CSV", message)
+    
+    def save_new_item(self):
+        """Save the new product to the database on a worker thread."""
+        product_data = self.collect_product_data()
+        if product_data is None:
+            return
+        self.insert_new_item(product_data, overwrite=False)
+    
+    def insert_new_item(self, product_data, overwrite):
+        """Run controller.insert_product on a worker thread with the save button disabled."""
+        # Block a second click until this insert has finished
+        self.save_button.config(state=tk.DISABLED)
+        self.controller.run_in_background(partial(self.controller.insert_product, overwrite=overwrite),
+                                          partial(self.on_new_item_saved, product_data),
+                                          product_data)
+    
+    def on_new_item_saved(self, product_data, result, error):
+        """Report the outcome of save_new_item (runs on the Tk thread)."""
+        self.save_button.config(state=tk.NORMAL)
+        if isinstance(error, pymysql.MySQLError) and error.args[0] == db_config.ER_DUP_ENTRY:
+            # Only overwrite an existing product's details once the user agrees
+            if messagebox.askyesno("UPC Already Exists",
+                                   f"A product with UPC {product_data['upc']} already exists.\n\n"
+                                   "Replace its name, description, category, case size and unit price "
+                                   "with the values entered? Its quantity on hand is kept."):
+                self.insert_new_item(product_data, overwrite=True)
+            return
+        if isinstance(error, pymysql.MySQLError) and error.args[0] == db_config.ER_CHECK_CONSTRAINT_VIOLATED:
+            messagebox.showerror("Input Error", f"The product was rejected by the database: {error.args[1]}")
+            return
+        if error is not None:
+            messagebox.showerror("Database Error", f"Error adding product: {error}")
             return
         
-        try:
-            with self.controller.db_connection.cursor() as cursor:
-                # Insert the new product into the database
-                query = """
-                    INSERT INTO products (upc, product_name, description, category, 
-                                          current_quantity, case_size, unit_price)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """
-                cursor.execute(query, (
-                    product_data["upc"],
-                    product_data["product_name"],
-                    product_data["description"],
-                    product_data["category"],
-                    product_data["current_quantity"],
-                    product_data["case_size"],
-                    product_data["unit_price"]
-                ))
-                self.controller.db_connection.commit()
-                messagebox.showinfo("Success", "New product added successfully.")
-                self.destroy()  # Close the window
-        except pymysql.MySQLError as e:
-            messagebox.showerror("Database Error", f"Error adding product: {e}")
+        product_id, affected = result
+        self.controller.invalidate_caches()
+        self.controller.add_category(product_data["category"])
+        if self.controller.product_index is not None:
+            self.controller.product_index.set_product(product_id, product_data["upc"],
+                                                      product_data["product_name"])
+        if affected == 1:
+            messagebox.showinfo("Success", "New product added successfully.")
+        elif affected == 2:
+            messagebox.showinfo("Success", f"UPC {product_data['upc']} already existed; that product's details were updated (quantity kept).")
+        else:
+            messagebox.showinfo("Success", f"UPC {product_data['upc']} already existed with the same details.")
+        self.reset_fields()
+        self.withdraw()  # Hide the window for reuse
 
 # Run the application if this script is executed directly
 if __name__ == "__main__":
@@ -5,121 +5,225 @@ G2J Inventory Management System - Inventory Viewer
 This script displays the current inventory levels and reorder status.
 
 Usage:
-    python inventory_view.py
+    python inventory_view.py [--page-size N] [--summary-only]
 """
 
+import sys
+import argparse
+from collections import namedtuple
 import pymysql #type: ignore
-from tabulate import tabulate #type: ignore
-
-# Configuration for database connection
-DB_CONFIG = {
-    "host": "localhost",
-    "user": "root",
-    "password": "2842254K",
-    "database": "G2J_InventoryManagement",
-    "charset": "utf8mb4",
-    "cursorclass": pymysql.cursors.DictCursor
-}
+from pymysql.constants import CLIENT #type: ignore
+import db_config
+
+# Default number of products fetched and printed per page
+DEFAULT_PAGE_SIZE = 500
+
+# One page of the inventory listing, in (category, product_name, product_id)
+# order. NULL categories sort as '' so the keyset comparison stays total.
+INVENTORY_PAGE_SQL = (
+    "SELECT product_id, upc, product_name, current_quantity, reorder_point, "
+    "reorder_quantity, unit_price, COALESCE(category, '') AS sort_category, "
+    "CASE WHEN current_quantity <= reorder_point THEN 'REORDER' "
+    "     WHEN current_quantity <= reorder_point * 2 THEN 'LOW' "
+    "     ELSE 'OK' END AS status "
+    "FROM products {where}"
+    "ORDER BY sort_category, product_name, product_id LIMIT %s"
+)
+INVENTORY_KEYSET_WHERE = "WHERE (COALESCE(category, ''), product_name, product_id) > (%s, %s, %s) "
+
+# Inventory summary counts
+SUMMARY_SQL = (
+    "SELECT COUNT(*) AS total_count, "
+    "SUM(current_quantity <= reorder_point) AS reorder_count, "
+    "SUM(current_quantity <= reorder_point * 2 AND current_quantity > reorder_point) AS low_count "
+    "FROM products"
+)
+
+# Pending reorders, oldest first (executed without parameters, so the
+# DATE_FORMAT % signs are sent as-is)
+PENDING_REORDERS_SQL = (
+    "SELECT r.reorder_id, p.product_name, r.quantity, "
+    "DATE_FORMAT(r.date_requested, '%Y-%m-%d %H:%i:%s') AS date_requested_str, r.status "
+    "FROM reorders r "
+    "JOIN products p ON r.product_id = p.product_id "
+    "WHERE r.status = 'PENDING' "
+    "ORDER BY r.date_requested"
+)
+
+# Row types for tuple cursor results, in SELECT column order
+Product = namedtuple('Product', ['product_id', 'upc', 'product_name', 'current_quantity', 'reorder_point',
+                                 'reorder_quantity', 'unit_price', 'sort_category', 'status'])
+Reorder = namedtuple('Reorder', ['reorder_id', 'product_name', 'quantity', 'date_requested_str', 'status'])
+
+# Pending reorders grid, printed with fixed column widths as rows stream in
+REORDER_HEADERS = ["Reorder ID", "Product Name", "Quantity", "Date Requested", "Status"]
+REORDER_COLUMN_WIDTHS = [10, 30, 8, 19, 7]
+# Flush stdout after this many streamed reorder rows
+REORDER_FLUSH_ROWS = 100
 
 def connect_to_database():
-    """Establish a connection to the MySQL database."""
+    """
+    Establish a connection to the MySQL database.
+    
+    The connection allows multi-statement queries so the summary and
+    pending-reorders queries can share one round trip. It is opened
+    directly rather than from the db_config pool, since this script only
+    ever uses one connection.
+    """
     try:
-        connection = pymysql.connect(**DB_CONFIG)
+        connection = pymysql.connect(**db_config.DB_CONFIG, client_flag=CLIENT.MULTI_STATEMENTS)
         print("Successfully connected to the database.")
         return connection
     except pymysql.MySQLError as e:
         print(f"Error connecting to the database: {e}")
         exit(1)
 
-def display_inventory(connection):
-    """Display the current inventory levels and status."""
+def format_table(headers, rows):
+    """
+    Format rows as a plain text table with a header and separator line.
+    
+    A lightweight alternative to tabulate's grid format for large tables:
+    column widths are measured in one pass and every row is rendered with
+    a single prebuilt format template.
+    
+    Args:
+        headers (list): Column headings
+        rows (list): Row tuples, one value per column
+        
+    Returns:
+        str: The formatted table
+    """
+    widths = [len(header) for header in headers]
+    for i, column in enumerate(zip(*rows)):
+        widths[i] = max(widths[i], max(map(len, map(str, column))))
+    
+    template = " | ".join(f"{{!s:<{width}}}" for width in widths)
+    separator = "-+-".join("-" * width for width in widths)
+    lines = [template.format(*headers), separator]
+    lines.extend(template.format(*row) for row in rows)
+    return "\n".join(lines)
+
+def display_inventory(connection, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Display the current inventory levels and status.
+    
+    Products are fetched and printed one page at a time using keyset
+    pagination on (category, product_name, product_id), so memory use is
+    bounded by the page size and output starts after the first page.
+    
+    Args:
+        connection: Database connection
+        page_size (int): Number of products fetched and printed per page
+    """
+    headers = ["ID", "UPC", "Product Name", "Quantity", "Reorder At", "Reorder Qty", "Unit Price", "Status"]
+    format_price = "${:.2f}".format
+    
     try:
-        with connection.cursor() as cursor:
-            cursor.execute(
-                "SELECT product_id, upc, product_name, current_quantity, reorder_point, "
-                "reorder_quantity, unit_price FROM products ORDER BY category, product_name"
-            )
-            products = cursor.fetchall()
-            
-            if not products:
-                print("No products found in inventory.")
-                return
-            
-            # Prepare data for display
-            table_data = []
-            for product in products:
-                # Determine status
-                if product['current_quantity'] <= product['reorder_point']:
-                    status = "REORDER"
-                elif product['current_quantity'] <= product['reorder_point'] * 2:
-                    status = "LOW"
+        printed = False
+        last_key = None
+        with connection.cursor(pymysql.cursors.Cursor) as cursor:
+            while True:
+                # The status column is classified by MySQL rather than in Python
+                if last_key is None:
+                    cursor.execute(INVENTORY_PAGE_SQL.format(where=""), (page_size,))
                 else:
-                    status = "OK"
+                    cursor.execute(INVENTORY_PAGE_SQL.format(where=INVENTORY_KEYSET_WHERE),
+                                   (*last_key, page_size))
+                products = list(map(Product._make, cursor.fetchall()))
+                if not products:
+                    break
                 
-                table_data.append([
-                    product['product_id'],
-                    product['upc'],
-                    product['product_name'],
-                    product['current_quantity'],
-                    product['reorder_point'],
-                    product['reorder_quantity'],
-                    f"${product['unit_price']:.2f}",
-                    status
-                ])
-            
-            # Print the table
-            headers = ["ID", "UPC", "Product Name", "Quantity", "Reorder At", "Reorder Qty", "Unit Price", "Status"]
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
-            
-            # Print summary
-            reorder_count = sum(1 for row in table_data if row[7] == "REORDER")
-            low_count = sum(1 for row in table_data if row[7] == "LOW")
-            
-            print(f"\nSummary: {len(products)} total products")
-            print(f"         {reorder_count} products need reordering")
-            print(f"         {low_count} products are running low")
-            
+                # Prepare data for display
+                table_data = []
+                append = table_data.append
+                for p in products:
+                    append((p.product_id, p.upc, p.product_name, p.current_quantity, p.reorder_point,
+                            p.reorder_quantity, format_price(p.unit_price), p.status))
+                
+                # Print the page
+                if printed:
+                    sys.stdout.write("\n")
+                sys.stdout.write(format_table(headers, table_data))
+                sys.stdout.write("\n")
+                printed = True
+                
+                last = products[-1]
+                last_key = (last.sort_category, last.product_name, last.product_id)
+        
     except pymysql.MySQLError as e:
         print(f"Database error: {e}")
 
-def display_pending_reorders(connection):
-    """Display pending reorder requests."""
+def print_pending_reorders(rows):
+    """
+    Print pending reorders as a grid, writing each row as it arrives.
+    
+    Column widths are fixed up front (values longer than a column simply
+    widen that row), so nothing has to be buffered to measure them.
+    
+    Args:
+        rows: Iterable of Reorder rows, typically an unbuffered cursor
+    """
+    write = sys.stdout.write
+    template = "| " + " | ".join(f"{{!s:<{width}}}" for width in REORDER_COLUMN_WIDTHS) + " |\n"
+    border = "+" + "+".join("-" * (width + 2) for width in REORDER_COLUMN_WIDTHS) + "+\n"
+    
+    count = 0
+    for reorder in rows:
+        if not count:
+            write("\nPending Reorders:\n")
+            write(border)
+            write(template.format(*REORDER_HEADERS))
+            write(border.replace("-", "="))
+        write(template.format(*reorder))
+        write(border)
+        count += 1
+        if count % REORDER_FLUSH_ROWS == 0:
+            sys.stdout.flush()
+    
+    if not count:
+        write("\nNo pending reorders found.\n")
+    sys.stdout.flush()
+
+def display_summary_and_reorders(connection):
+    """
+    Display the inventory summary and the pending reorders.
+    
+    Both queries are sent in one round trip. The reorders result is read
+    through an unbuffered cursor and printed row by row as it streams in.
+    
+    Args:
+        connection: Database connection opened with CLIENT.MULTI_STATEMENTS
+    """
     try:
-        with connection.cursor() as cursor:
-            cursor.execute(
-                "SELECT r.reorder_id, p.product_name, r.quantity, r.date_requested, r.status "
-                "FROM reorders r "
-                "JOIN products p ON r.product_id = p.product_id "
-                "WHERE r.status = 'PENDING' "
-                "ORDER BY r.date_requested"
-            )
-            reorders = cursor.fetchall()
-            
-            if not reorders:
-                print("\nNo pending reorders found.")
-                return
+        with connection.cursor(pymysql.cursors.SSCursor) as cursor:
+            cursor.execute(f"{SUMMARY_SQL}; {PENDING_REORDERS_SQL}")
+            # Read the summary result to its end so the next result can be opened
+            total_count, reorder_count, low_count = cursor.fetchall()[0]
             
-            print("\nPending Reorders:")
-            # Prepare data for display
-            table_data = []
-            for reorder in reorders:
-                table_data.append([
-                    reorder['reorder_id'],
-                    reorder['product_name'],
-                    reorder['quantity'],
-                    reorder['date_requested'].strftime('%Y-%m-%d %H:%M:%S'),
-                    reorder['status']
-                ])
-            
-            # Print the table
-            headers = ["Reorder ID", "Product Name", "Quantity", "Date Requested", "Status"]
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
+            if not total_count:
+                print("No products found in inventory.")
+            else:
+                print(f"\nSummary: {total_count} total products")
+                print(f"         {reorder_count or 0} products need reordering")
+                print(f"         {low_count or 0} products are running low")
             
+            cursor.nextset()
+            print_pending_reorders(map(Reorder._make, cursor))
+        
     except pymysql.MySQLError as e:
         print(f"Database error: {e}")
 
 def main():
     """Main function to display inventory information."""
+    parser = argparse.ArgumentParser(description="Display current inventory levels and pending reorders.")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE,
+                        help=f"products fetched and printed per page (default: {DEFAULT_PAGE_SIZE})")
+    parser.add_argument("--summary-only", action="store_true",
+                        help="print only the inventory summary counts, not the product listing")
+    args = parser.parse_args()
+    if args.page_size < 1:
+        parser.error("--page-size must be at least 1")
+    
     print("G2J Inventory Management System - Current Inventory Status")
     print("=" * 70)
     
@@ -128,10 +232,11 @@ def main():
     
     try:
         # Display inventory status
-        display_inventory(connection)
+        if not args.summary_only:
+            display_inventory(connection, args.page_size)
         
-        # Display pending reorders
-        display_pending_reorders(connection)
+        # Display the summary and pending reorders (one round trip)
+        display_summary_and_reorders(connection)
         
     finally:
         connection.close()
@@ -8,6 +8,8 @@ products when the number of units sold reaches a multiple of the case size.
 
 Usage:
     python reorder_generator.py [input_file]
+
+The GUI imports this module and calls process_sales_file() directly.
 """
 
 import sys
@@ -15,33 +17,30 @@ import os
 import pymysql #type: ignore
 from collections import Counter
 from datetime import datetime
+import db_config
 
-# Configuration for database connection
-DB_CONFIG = {
-    "host": "localhost",
-    "user": "root",
-    "password": "2842254K",
-    "database": "G2J_InventoryManagement",
-    "charset": "utf8mb4",
-    "cursorclass": pymysql.cursors.DictCursor
-}
-
-def connect_to_database():
-    """Establish a connection to the MySQL database."""
+def connect_to_database(log=print):
+    """
+    Get a connection to the MySQL database (from the shared pool in db_config).
+    
+    Args:
+        log (callable): Receives each progress or error message (print by default)
+    """
     try:
-        connection = pymysql.connect(**DB_CONFIG)
-        print("Successfully connected to the database.")
+        connection = db_config.connect()
+        log("Successfully connected to the database.")
         return connection
     except pymysql.MySQLError as e:
-        print(f"Error connecting to the database: {e}")
+        log(f"Error connecting to the database: {e}")
         sys.exit(1)
 
-def count_sales(input_file):
+def count_sales(input_file, log=print):
     """
     Read the input file and count occurrences of each UPC code.
     
     Args:
         input_file (str): Path to the input file containing one UPC per line
+        log (callable): Receives each progress or error message (print by default)
         
     Returns:
         Counter: Dictionary-like object with UPC codes as keys and quantities as values
@@ -53,16 +52,16 @@ def count_sales(input_file):
             
         # Count occurrences of each UPC
         sales_count = Counter(upcs)
-        print(f"Processed {len(upcs)} sales transactions with {len(sales_count)} unique products.")
+        log(f"Processed {len(upcs)} sales transactions with {len(sales_count)} unique products.")
         return sales_count
     except FileNotFoundError:
-        print(f"Error: Input file '{input_file}' not found.")
+        log(f"Error: Input file '{input_file}' not found.")
         sys.exit(1)
     except Exception as e:
-        print(f"Error reading input file: {e}")
+        log(f"Error reading input file: {e}")
         sys.exit(1)
 
-def check_inventory_levels(connection, sales_data):
+def check_inventory_levels(connection, sales_data, log=print):
     """
     Check current inventory levels against sales data to determine what needs reordering
     based on case size logic.
@@ -70,32 +69,34 @@ def check_inventory_levels(connection, sales_data):
     Args:
         connection: Database connection
         sales_data (Counter): Dictionary with UPC codes and quantities sold
+        log (callable): Receives each progress or error message (print by default)
         
     Returns:
         list: Items that need to be reordered with their details
     """
     reorder_list = []
     products_with_cases_consumed = {}
+    if not sales_data:
+        log("Identified 0 products that need reordering.")
+        return reorder_list
     
     try:
         with connection.cursor() as cursor:
+            # Get product info for every sold UPC in one query
+            cursor.execute(
+                "SELECT upc, product_id, product_name, current_quantity, case_size FROM products WHERE upc IN %s",
+                (tuple(sales_data),)
+            )
+            products_by_upc = {product['upc']: product for product in cursor.fetchall()}
+            sold = [] # (product_id, quantity_sold) pairs for the inventory update
+            
             for upc, quantity_sold in sales_data.items():
-                # Get product info from database
-                cursor.execute(
-                    "SELECT product_id, product_name, current_quantity, case_size FROM products WHERE upc = %s", 
-                    (upc,)
-                )
-                product = cursor.fetchone()
+                product = products_by_upc.get(upc)
                 
                 if product:
                     # Calculate new quantity after sales
                     new_quantity = product['current_quantity'] - quantity_sold
-                    
-                    # Update the inventory in the database
-                    cursor.execute(
-                        "UPDATE products SET current_quantity = %s WHERE product_id = %s",
-                        (new_quantity, product['product_id'])
-                    )
+                    sold.append((product['product_id'], quantity_sold))
                     
                     # Check if the number of units sold is a multiple of case size
                     if product['case_size'] > 0 and quantity_sold % product['case_size'] == 0:
@@ -116,7 +117,20 @@ def check_inventory_levels(connection, sales_data):
                                     'cases_consumed': cases_consumed
                                 }
                 else:
-                    print(f"Warning: Product with UPC {upc} not found in database.")
+                    log(f"Warning: Product with UPC {upc} not found in database.")
+            
+            if sold:
+                # Update the inventory in the database with one statement, joining
+                # against the (product_id, quantity_sold) pairs as a derived table.
+                # The subtraction happens in SQL, so sales recorded since the
+                # SELECT above are not overwritten.
+                cursor.execute(
+                    "UPDATE products p JOIN (SELECT %s AS product_id, %s AS quantity_sold"
+                    + " UNION ALL SELECT %s, %s" * (len(sold) - 1)
+                    + ") s ON p.product_id = s.product_id"
+                    " SET p.current_quantity = p.current_quantity - s.quantity_sold",
+                    [value for pair in sold for value in pair]
+                )
             
             # Add all products that had at least one full case consumed to the reorder list
             reorder_list = list(products_with_cases_consumed.values())
@@ -124,14 +138,14 @@ def check_inventory_levels(connection, sales_data):
             # Commit the changes to the database
             connection.commit()
             
-        print(f"Identified {len(reorder_list)} products that need reordering.")
+        log(f"Identified {len(reorder_list)} products that need reordering.")
         return reorder_list
     except pymysql.MySQLError as e:
         connection.rollback()
-        print(f"Database error while checking inventory: {e}")
+        log(f"Database error while checking inventory: {e}")
         sys.exit(1)
 
-def generate_reorder_report(reorder_list, output_file):
+def generate_reorder_report(reorder_list, output_file, log=print):
     """
     Generate a reorder report and save to the output file.
     For each case consumed, output the UPC once.
@@ -139,9 +153,10 @@ def generate_reorder_report(reorder_list, output_file):
     Args:
         reorder_list (list): Items that need to be reordered
         output_file (str): Path to the output file
+        log (callable): Receives each progress or error message (print by default)
     """
     if not reorder_list:
-        print("No items need to be reordered.")
+        log("No items need to be reordered.")
         with open(output_file, 'w') as file:
             file.write("No items need to be reordered.\n")
         return
@@ -156,18 +171,19 @@ def generate_reorder_report(reorder_list, output_file):
                 for _ in range(cases_consumed):
                     file.write(f"{upc}\n")
         
-        print(f"Reorder report generated successfully: {output_file}")
+        log(f"Reorder report generated successfully: {output_file}")
     except Exception as e:
-        print(f"Error generating reorder report: {e}")
+        log(f"Error generating reorder report: {e}")
         sys.exit(1)
 
-def create_reorder_records(connection, reorder_list):
+def create_reorder_records(connection, reorder_list, log=print):
     """
     Add reorder records to the database.
     
     Args:
         connection: Database connection
         reorder_list (list): Items that need to be reordered
+        log (callable): Receives each progress or error message (print by default)
     """
     if not reorder_list:
         return
@@ -175,64 +191,79 @@ def create_reorder_records(connection, reorder_list):
     try:
         with connection.cursor() as cursor:
             current_date = datetime.now()
-            for item in reorder_list:
-                # Create a reorder record in the database based on cases consumed
-                quantity_to_order = item['cases_consumed'] * item['case_size']
-                
-                cursor.execute(
-                    "INSERT INTO reorders (product_id, quantity, date_requested, status) "
-                    "VALUES (%s, %s, %s, %s)",
-                    (item['product_id'], quantity_to_order, current_date, 'PENDING')
-                )
+            # Create a reorder record in the database based on cases consumed;
+            # executemany sends the rows as one multi-row INSERT
+            cursor.executemany(
+                "INSERT INTO reorders (product_id, quantity, date_requested, status) "
+                "VALUES (%s, %s, %s, %s)",
+                [(item['product_id'], item['cases_consumed'] * item['case_size'], current_date, 'PENDING')
+                 for item in reorder_list]
+            )
             
             # Commit the changes to the database
             connection.commit()
             
-        print(f"Created {len(reorder_list)} reorder request records in the database.")
+        log(f"Created {len(reorder_list)} reorder request records in the database.")
     except pymysql.MySQLError as e:
         connection.rollback()
-        print(f"Database error while creating reorder records: {e}")
+        log(f"Database error while creating reorder records: {e}")
         sys.exit(1)
 
-def main():
-    """Main function to orchestrate the reorder generation process."""
-    # Check command line arguments
-    if len(sys.argv) != 2:
-        print("Usage: python reorder_generator.py [input_file]")
-        sys.exit(1)
+def process_sales_file(input_file, log=print):
+    """
+    Apply a sales file to the inventory and write the reorder list for it.
     
-    input_file = sys.argv[1]
+    Progress is reported through log as it goes. Like the other steps,
+    failures are reported and end with sys.exit(1), so callers running
+    this in-process should catch SystemExit.
     
+    Args:
+        input_file (str): Path to the sales file (one UPC per line)
+        log (callable): Receives each progress or error message (print by default)
+        
+    Returns:
+        str: Path of the reorder list that was written
+    """
     output_files_directory = "/Users/kube/VSprojects/G2J_InventoryManagementSystem/ReOrder_Lists"
     os.makedirs(output_files_directory, exist_ok=True)
     # Generate the output file name based on the current date and time
     current_time = datetime.now().strftime("%m-%d-%Y_%H-%M-%S")
     output_file = os.path.join(output_files_directory, f"reorder_list_{current_time}.txt")
     
-    print(f"Starting reorder generation process...")
-    print(f"Input file: {input_file}")
-    print(f"Output file: {output_file}")
+    log(f"Starting reorder generation process...")
+    log(f"Input file: {input_file}")
+    log(f"Output file: {output_file}")
     
     # Process the input file
-    sales_data = count_sales(input_file)
+    sales_data = count_sales(input_file, log)
     
     # Connect to the database
-    connection = connect_to_database()
+    connection = connect_to_database(log)
     
     try:
         # Check inventory levels and get items for reordering
-        reorder_list = check_inventory_levels(connection, sales_data)
+        reorder_list = check_inventory_levels(connection, sales_data, log)
         
         # Create reorder records in the database
-        create_reorder_records(connection, reorder_list)
+        create_reorder_records(connection, reorder_list, log)
         
         # Generate the reorder report
-        generate_reorder_report(reorder_list, output_file)
+        generate_reorder_report(reorder_list, output_file, log)
         
-        print("Reorder generation process completed successfully.")
+        log("Reorder generation process completed successfully.")
     finally:
         connection.close()
-        print("Database connection closed.")
+        log("Database connection closed.")
+    return output_file
+
+def main():
+    """Main function to orchestrate the reorder generation process."""
+    # Check command line arguments
+    if len(sys.argv) != 2:
+        print("Usage: python reorder_generator.py [input_file]")
+        sys.exit(1)
+    
+    process_sales_file(sys.argv[1])
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -16,7 +16,11 @@ CREATE TABLE IF NOT EXISTS products (
     case_size INT NOT NULL DEFAULT 1,
     unit_price DECIMAL(10, 2) NOT NULL,
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FULLTEXT INDEX ft_products (product_name, description, upc),
+    INDEX idx_products_updated (updated_at DESC, product_id),
+    CONSTRAINT chk_products_case_size CHECK (case_size >= 1),
+    CONSTRAINT chk_products_unit_price CHECK (unit_price >= 0)
 );
 
 -- Create sales table to track daily sales
@@ -28,6 +32,13 @@ CREATE TABLE IF NOT EXISTS sales (
     FOREIGN KEY (product_id) REFERENCES products(product_id)
 );
 
+-- Create sales_test table (sales generated by generate_test_sales.py --target db)
+CREATE TABLE IF NOT EXISTS sales_test (
+    sale_id INT AUTO_INCREMENT PRIMARY KEY,
+    upc VARCHAR(20) NOT NULL,
+    sale_date DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Create reorders table
 CREATE TABLE IF NOT EXISTS reorders (
     reorder_id INT AUTO_INCREMENT PRIMARY KEY,
@@ -36,7 +47,8 @@ CREATE TABLE IF NOT EXISTS reorders (
     date_requested DATETIME NOT NULL,
     date_received DATETIME NULL,
     status ENUM('PENDING', 'ORDERED', 'RECEIVED', 'CANCELED') NOT NULL DEFAULT 'PENDING',
-    FOREIGN KEY (product_id) REFERENCES products(product_id)
+    FOREIGN KEY (product_id) REFERENCES products(product_id),
+    INDEX idx_reorders_status_date (status, date_requested)
 );
 
 -- Insert some sample product data
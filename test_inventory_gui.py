@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+G2J Inventory Management System - GUI helper tests
+
+Covers the parts of inventory_gui that run without a display or a
+database. Run with: python -m unittest test_inventory_gui
+"""
+
+import unittest
+from inventory_gui import ProductPrefixIndex, SimpleCache, fulltext_query, parse_product_fields
+
+class ProductPrefixIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = ProductPrefixIndex([(1, "123456789012", "Milk (1 gallon)")])
+
+    def test_set_product_renames_indexed_product(self):
+        self.index.set_product(1, product_name="Oat Milk")
+        self.assertEqual(self.index.suggestions("oat"), ["Oat Milk"])
+        self.assertEqual(self.index.suggestions("milk"), [])
+        self.assertEqual(self.index.suggestions("1234"), ["123456789012"])
+
+    def test_set_product_ignores_unknown_id_without_upc(self):
+        # A product added outside the app after the index was loaded
+        self.index.set_product(2, product_name="Bread (White)")
+        self.assertEqual(self.index.suggestions("bread"), [])
+        self.assertNotIn(2, self.index.products)
+
+    def test_set_product_adds_unknown_id_with_upc_and_name(self):
+        self.index.set_product(2, upc="234567890123", product_name="Bread (White)")
+        self.assertEqual(self.index.suggestions("bread"), ["Bread (White)"])
+        self.assertEqual(self.index.suggestions("2345"), ["234567890123"])
+
+class FulltextQueryTest(unittest.TestCase):
+    def test_operators_split_words(self):
+        # "K" is below the minimum token size, "Cup" is indexed on its own
+        self.assertEqual(fulltext_query("K-Cup"), "+Cup*")
+        self.assertEqual(fulltext_query("milk (1 gallon)"), "+milk* +gallon*")
+
+    def test_no_usable_words_falls_back(self):
+        self.assertIsNone(fulltext_query("A & W"))
+        self.assertIsNone(fulltext_query("+-*"))
+
+class SimpleCacheTest(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = SimpleCache(maxsize=2)
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.pop("c"), 3)
+        self.assertIsNone(cache.pop("c"))
+
+    def test_expired_entry_reads_as_missing(self):
+        cache = SimpleCache(maxsize=1, ttl=-1) # Every entry is already expired
+        cache["recent"] = [1]
+        self.assertIsNone(cache.get("recent"))
+
+class ParseProductFieldsTest(unittest.TestCase):
+    def parse(self, **values):
+        return parse_product_fields({"upc": "123456789012", "product_name": "Milk", **values})
+
+    def test_converts_numbers(self):
+        product = self.parse(current_quantity="5", case_size="12", unit_price="3.49")
+        self.assertEqual((product["current_quantity"], product["case_size"], product["unit_price"]), (5, 12, 3.49))
+
+    def test_rejects_non_finite_unit_price(self):
+        for price in ("nan", "inf", "-inf"):
+            with self.assertRaisesRegex(ValueError, "Unit price must be a finite number"):
+                self.parse(unit_price=price)
+
+    def test_rejects_negative_unit_price(self):
+        with self.assertRaisesRegex(ValueError, "Unit price cannot be negative"):
+            self.parse(unit_price="-0.01")
+
+    def test_rejects_text_longer_than_its_column(self):
+        with self.assertRaisesRegex(ValueError, "Product Name cannot be longer than 100"):
+            self.parse(product_name="x" * 101)
+        with self.assertRaisesRegex(ValueError, "UPC cannot be longer than 20"):
+            parse_product_fields({"upc": "1" * 21, "product_name": "Milk"})
+
+if __name__ == "__main__":
+    unittest.main()